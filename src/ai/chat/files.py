@@ -57,13 +57,15 @@ class AttachmentProcessor:
             },
         )
         cache_key = f"{display_name}_{len(data_bytes)}"
-        if cache_key in self._gemini_file_cache:
+        cached_file = self._gemini_file_cache.get(cache_key)
+        if cached_file is not None:
             log.info(f"Cache hit for media '{display_name}'.")
-            return self._gemini_file_cache[cache_key]
+            return cached_file
         async with self._upload_locks[cache_key]:
-            if cache_key in self._gemini_file_cache:
+            cached_file = self._gemini_file_cache.get(cache_key)
+            if cached_file is not None:
                 log.info(f"Cache hit for media '{display_name}' after acquiring lock.")
-                return self._gemini_file_cache[cache_key]
+                return cached_file
             try:
                 log.info(f"Cache miss for media '{display_name}'. Uploading to Gemini.")
                 gemini_file = await self.gemini_core.upload_media_bytes(data_bytes, display_name, mime_type)
@@ -64,8 +64,7 @@ class ChatSessionManager:
             keys_to_remove = list(self._sessions.keys())[: len(self._sessions) - self._max_sessions]
             for key in keys_to_remove:
                 del self._sessions[key]
-                if key in self._session_locks:
-                    del self._session_locks[key]
+                self._session_locks.pop(key, None)
 
     async def _get_session_key(self, message: discord.Message) -> int:
         """
@@ -144,11 +143,13 @@ class ChatSessionManager:
             session_to_use.leaf_message_id = message.id
             self._sessions[session_key] = self._sessions.pop(session_key)
             return session_to_use.chat
-        if session_key not in self._session_locks:
-            self._session_locks[session_key] = asyncio.Lock()
-        async with self._session_locks[session_key]:
-            if session_key in self._sessions and not is_branch:
-                return self._sessions[session_key].chat
+        session_lock = self._session_locks.get(session_key)
+        if session_lock is None:
+            session_lock = self._session_locks[session_key] = asyncio.Lock()
+        async with session_lock:
+            existing_session = None if is_branch else self._sessions.get(session_key)
+            if existing_session is not None:
+                return existing_session.chat
             log.info(
                 "Creating new chat session.",
                 extra={
@@ -170,8 +171,7 @@ class ChatSessionManager:
             chat = self._gemini_core.client.chats.create(model=self._settings.MODEL_ID, config=config, history=history)
             new_session = ChatSession(chat=chat, root_message_id=session_key, leaf_message_id=message.id)
             self._sessions[session_key] = new_session
-            if session_key in self._session_locks:
-                del self._session_locks[session_key]
+            self._session_locks.pop(session_key, None)
             self._cleanup_old_sessions()
             return new_session.chat
 
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 from typing import Any, List, Optional, Tuple
@@ -13,16 +14,49 @@ from scraper.models import ScrapedData
 log = logging.getLogger("Bard")
 
 
+def _prompt_directory_mtime(directory: str) -> int:
+    """
+    Returns the newest modification time, in nanoseconds, of a prompt directory and its prompt files.
+    Args:
+        directory: The path to the directory containing prompt files.
+    Returns:
+        The latest `st_mtime_ns` found, or 0 if the directory cannot be read.
+    """
+    try:
+        latest = os.stat(directory).st_mtime_ns
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".prompt.md"):
+                    latest = max(latest, entry.stat().st_mtime_ns)
+    except OSError:
+        return 0
+    return latest
+
+
 def load_prompts_from_directory(directory: str) -> str:
     """
     Loads all .prompt.md files from a specified directory and concatenates their content.
     If the directory is not found or no prompt files are present, a default prompt is returned.
+    Results are cached per directory and reused until a prompt file or the directory changes.
     Args:
         directory: The path to the directory containing prompt files.
     Returns:
         A single string containing the combined content of all prompt files,
         or a default prompt if no files are found or the directory is invalid.
     """
+    return _load_prompts_cached(directory, _prompt_directory_mtime(directory))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_prompts_cached(directory: str, mtime: int) -> str:
+    """
+    Reads and concatenates the prompt files in a directory.
+    Args:
+        directory: The path to the directory containing prompt files.
+        mtime: The directory's latest modification time, used only as part of the cache key.
+    Returns:
+        The combined prompt text, or a default prompt if none could be loaded.
+    """
     prompt_parts = []
     if not os.path.isdir(directory):
         log.warning(f"Prompt directory not found: {directory}. Using default prompt.")
@@ -127,13 +161,21 @@ class PromptBuilder:
                 if scraped_data.text_content:
                     prompt_parts.append(
                         gemini_types.Part(
-                            text=f"[SCRAPED CONTENT: {scraped_data.url.resolved}]\n{scraped_data.text_content}\n[/SCRAPED CONTENT]"
+                            text=(
+                                f"[SCRAPED CONTENT: {scraped_data.url.resolved}]\n"
+                                f"{scraped_data.text_content}\n"
+                                "[/SCRAPED CONTENT]"
+                            )
                         )
                     )
                 else:
                     prompt_parts.append(
                         gemini_types.Part(
-                            text=f"[SCRAPED URL: {scraped_data.url.resolved}]\n(No text content was extracted.)\n[/SCRAPED URL]"
+                            text=(
+                                f"[SCRAPED URL: {scraped_data.url.resolved}]\n"
+                                "(No text content was extracted.)\n"
+                                "[/SCRAPED URL]"
+                            )
                         )
                     )
                 if scraped_data.screenshot_data:
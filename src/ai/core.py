@@ -55,6 +55,8 @@ class GeminiCore:
         """
 
         try:
+            if kwargs.pop("stream", False):
+                return await self.client.aio.models.generate_content_stream(model=model, contents=contents, **kwargs)
             response = await self.client.aio.models.generate_content(model=model, contents=contents, **kwargs)
 
             return response
@@ -1,8 +1,9 @@
 import asyncio
-import base64
 import io
 import logging
-from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
+import math
+import os
+from typing import Any, AsyncGenerator, AsyncIterable, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
 import soundfile
@@ -11,72 +12,354 @@ from google.genai import types
 from ai.tools.base import BaseTool, ToolContext
 from settings import Settings
 
+try:
+    import av
+except ImportError:
+    av = None
+try:
+    import numba
+except ImportError:
+    numba = None
+
 log = logging.getLogger("Bard")
 DEFAULT_WAVEFORM = "FzYACgAAAAAAACQAAAAAAAA="
+_PIPE_BUFFER_SIZE = 1 << 20
+_BytesLike = Union[bytes, bytearray, memoryview]
+_TTS_PCM_SAMPLE_RATE = 24000
+_TTS_FFMPEG_ARGS = (
+    Settings.FFMPEG_PATH,
+    "-y",
+    "-f",
+    "s16le",
+    "-ar",
+    str(_TTS_PCM_SAMPLE_RATE),
+    "-ac",
+    "1",
+    "-i",
+    "-",
+    "-f",
+    "opus",
+    "-c:a",
+    "libopus",
+    "-b:a",
+    "64k",
+    "-ar",
+    "48000",
+    "-ac",
+    "1",
+    "-application",
+    "voip",
+    "-vbr",
+    "on",
+    "-",
+)
+_B64_ALPHABET = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/", dtype=np.uint8)
 
 
-async def _execute_ffmpeg(
-    arguments: List[str], input_data: Optional[bytes] = None, timeout: float = 30.0
-) -> Tuple[Optional[bytes], Optional[bytes], int]:
+class _FFmpegProcessPool:
     """
-    Executes an FFmpeg command with specified arguments and optional input data.
+    Keeps pre-spawned FFmpeg processes waiting on stdin for each argument list in use.
+    Every process still handles a single job, but process startup happens in the background
+    instead of on the request path.
     """
-    log.debug("Executing FFmpeg", extra={"arguments": arguments})
-    try:
+
+    def __init__(self, size: int):
+        """
+        Initializes the pool.
+        Args:
+            size: The number of idle processes to keep ready per argument list.
+        """
+        self.size = size
+        self._idle: Dict[Tuple[str, ...], List[asyncio.subprocess.Process]] = {}
+        self._pending: Dict[Tuple[str, ...], int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._closed = False
+
+    async def _spawn(self, key: Tuple[str, ...]) -> asyncio.subprocess.Process:
+        """
+        Spawns a new FFmpeg process with piped stdin, stdout and stderr.
+        """
         process = await asyncio.create_subprocess_exec(
-            *arguments,
+            *key,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            limit=_PIPE_BUFFER_SIZE,
         )
+        if process.stdin is not None:
+            process.stdin.transport.set_write_buffer_limits(high=_PIPE_BUFFER_SIZE)
+        return process
+
+    async def _refill(self, key: Tuple[str, ...]) -> None:
+        """
+        Spawns one idle process for the given argument list.
+        """
         try:
-            stdout_data, stderr_data = await asyncio.wait_for(process.communicate(input=input_data), timeout=timeout)
-        except asyncio.TimeoutError:
-            log.debug(f"FFmpeg process timed out after {timeout} seconds.")
-            process.kill()
-            _, stderr_data_after_kill = await process.communicate()
-            error_message = b"Process timed out. " + (stderr_data_after_kill or b"")
-            return None, error_message.strip(), -1
-        return_code = process.returncode if process.returncode is not None else -1
-        return stdout_data, stderr_data, return_code
+            self._idle.setdefault(key, []).append(await self._spawn(key))
+        except Exception as e:
+            log.debug(f"Failed to pre-spawn FFmpeg process: {e}")
+        finally:
+            self._pending[key] -= 1
+
+    def _schedule_refill(self, key: Tuple[str, ...]) -> None:
+        """
+        Schedules background spawns until the idle and pending processes reach the pool size.
+        Idle processes that have exited in the meantime are dropped first so they get replaced.
+        """
+        if self._closed:
+            return
+        idle = self._idle.get(key)
+        if idle:
+            idle[:] = [process for process in idle if process.returncode is None]
+        missing = self.size - len(idle or ()) - self._pending.get(key, 0)
+        for _ in range(missing):
+            self._pending[key] = self._pending.get(key, 0) + 1
+            task = asyncio.create_task(self._refill(key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def acquire(self, arguments: Sequence[str]) -> asyncio.subprocess.Process:
+        """
+        Returns a ready FFmpeg process for the given arguments, spawning one if none is idle.
+        Args:
+            arguments: The full FFmpeg command line.
+        Returns:
+            A running process that has not received any input yet.
+        """
+        key = tuple(arguments)
+        idle = self._idle.get(key, [])
+        process = None
+        while idle:
+            candidate = idle.pop()
+            if candidate.returncode is None:
+                process = candidate
+                break
+        if process is None:
+            process = await self._spawn(key)
+        self._schedule_refill(key)
+        return process
+
+    async def close(self) -> None:
+        """
+        Stops refilling the pool and kills every idle process.
+        """
+        self._closed = True
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        processes = [process for idle in self._idle.values() for process in idle]
+        self._idle.clear()
+        for process in processes:
+            if process.returncode is None:
+                process.kill()
+        if processes:
+            await asyncio.gather(*(process.wait() for process in processes), return_exceptions=True)
+        log.debug("FFmpeg process pool closed.", extra={"killed": len(processes)})
+
+
+_ffmpeg_pool = _FFmpegProcessPool(size=min(4, os.cpu_count() or 1))
+
+
+async def close_ffmpeg_pool() -> None:
+    """
+    Kills the idle FFmpeg processes kept ready for audio conversion. Called on bot shutdown.
+    """
+    await _ffmpeg_pool.close()
+
+
+async def _execute_ffmpeg(
+    arguments: Sequence[str], input_chunks: AsyncIterable[_BytesLike], timeout: float = 30.0
+) -> Tuple[Optional[bytes], Optional[bytes], int]:
+    """
+    Executes an FFmpeg command with specified arguments, writing input chunks to stdin as they arrive.
+    Errors raised while producing the input are re-raised after the process is killed and reaped
+    and its output readers are cancelled.
+    The timeout applies once all input has been written.
+    """
+    log.debug("Executing FFmpeg", extra={"arguments": arguments})
+    try:
+        process = await _ffmpeg_pool.acquire(arguments)
     except FileNotFoundError:
         log.critical(f"FFmpeg executable not found: '{arguments[0]}'. Ensure it's installed and in PATH.")
         return None, b"FFmpeg not found", -1
     except Exception as e:
         log.critical(f"FFmpeg execution failed: {str(e)}")
         return None, str(e).encode(), -1
+    stdin, stdout, stderr = process.stdin, process.stdout, process.stderr
+    if stdin is None or stdout is None or stderr is None:
+        process.kill()
+        return None, b"FFmpeg pipes are unavailable", -1
+    output = asyncio.gather(stdout.read(), stderr.read())
+    try:
+        try:
+            async for chunk in input_chunks:
+                stdin.write(chunk)
+                await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            log.debug("FFmpeg closed its input before all data was written.")
+        finally:
+            stdin.close()
+    except BaseException:
+        process.kill()
+        output.cancel()
+        await asyncio.gather(output, process.wait(), return_exceptions=True)
+        raise
+    try:
+        stdout_data, stderr_data = await asyncio.wait_for(asyncio.shield(output), timeout=timeout)
+    except asyncio.TimeoutError:
+        log.debug(f"FFmpeg process timed out after {timeout} seconds.")
+        process.kill()
+        _, stderr_data_after_kill = await output
+        error_message = b"Process timed out. " + (stderr_data_after_kill or b"")
+        return None, error_message.strip(), -1
+    return_code = await process.wait()
+    return stdout_data, stderr_data, return_code
 
 
-async def _convert_audio(
-    input_data: bytes,
-    input_format: str,
-    output_format: str,
-    input_args: List[str] = [],
-    output_args: List[str] = [],
-    timeout: float = 30.0,
-) -> Optional[bytes]:
+class _OpusEncoder:
     """
-    Converts audio data between specified formats using FFmpeg.
+    Encodes mono s16le PCM to OGG Opus in-process with PyAV, using the same settings as the FFmpeg command.
+    Calls are blocking and are meant to run in a worker thread.
     """
-    args = [
-        Settings.FFMPEG_PATH,
-        "-y",
-        "-f",
-        input_format,
-        *input_args,
-        "-i",
-        "-",
-        "-f",
-        output_format,
-        *output_args,
-        "-",
-    ]
-    stdout, stderr, return_code = await _execute_ffmpeg(args, input_data, timeout)
-    if return_code == 0 and stdout:
-        return stdout
-    error_msg = stderr.decode(errors="ignore") if stderr else "Unknown error"
-    log.error(f"Audio conversion failed with code {return_code}: {error_msg}")
-    return None
+
+    def __init__(self, input_sample_rate: int):
+        """
+        Initializes the encoder.
+        Args:
+            input_sample_rate: The sample rate of the incoming PCM data in Hz.
+        """
+        self.input_sample_rate = input_sample_rate
+        self._output = io.BytesIO()
+        self._container = av.open(self._output, mode="w", format="ogg")
+        self._stream = self._container.add_stream("libopus", rate=48000, layout="mono")
+        self._stream.bit_rate = 64000
+        self._stream.options = {"application": "voip", "vbr": "on"}
+        self._resampler = av.AudioResampler(format="s16", layout="mono", rate=48000)
+        self._remainder = b""
+
+    def _push(self, frame: Any) -> None:
+        """
+        Resamples a frame (or flushes the resampler with None) and muxes the encoded packets.
+        """
+        for resampled_frame in self._resampler.resample(frame):
+            for packet in self._stream.encode(resampled_frame):
+                self._container.mux(packet)
+
+    def encode(self, pcm_chunk: _BytesLike) -> None:
+        """
+        Encodes a PCM chunk, holding back a trailing partial sample until the next chunk.
+        """
+        data = self._remainder + pcm_chunk if self._remainder else pcm_chunk
+        usable = len(data) - len(data) % 2
+        self._remainder = bytes(data[usable:])
+        if not usable:
+            return
+        samples = np.frombuffer(data, dtype=np.int16, count=usable // 2).reshape(1, -1)
+        frame = av.AudioFrame.from_ndarray(samples, format="s16", layout="mono")
+        frame.sample_rate = self.input_sample_rate
+        self._push(frame)
+
+    def finish(self) -> bytes:
+        """
+        Flushes the resampler and encoder, closes the container and returns the OGG Opus bytes.
+        """
+        self._push(None)
+        for packet in self._stream.encode(None):
+            self._container.mux(packet)
+        self._container.close()
+        return self._output.getvalue()
+
+
+async def _encode_opus_in_process(input_chunks: AsyncIterable[_BytesLike], input_sample_rate: int) -> bytes:
+    """
+    Encodes streamed PCM chunks to OGG Opus with PyAV, running each encoding step in a worker thread.
+    """
+    encoder = await asyncio.to_thread(_OpusEncoder, input_sample_rate)
+    async for chunk in input_chunks:
+        await asyncio.to_thread(encoder.encode, chunk)
+    return await asyncio.to_thread(encoder.finish)
+
+
+def _encode_waveform_b64(waveform_raw_bytes: Any) -> str:
+    """
+    Encodes waveform bytes to base64 using a vectorized lookup over 6-bit fields.
+    Args:
+        waveform_raw_bytes: A bytes-like object containing the waveform values.
+    Returns:
+        The padded base64 string.
+    """
+    data = np.frombuffer(waveform_raw_bytes, dtype=np.uint8)
+    padding = -data.size % 3
+    if padding:
+        data = np.concatenate((data, np.zeros(padding, dtype=np.uint8)))
+    triplets = data.reshape(-1, 3)
+    indices = np.empty((triplets.shape[0], 4), dtype=np.uint8)
+    indices[:, 0] = triplets[:, 0] >> 2
+    indices[:, 1] = ((triplets[:, 0] & 3) << 4) | (triplets[:, 1] >> 4)
+    indices[:, 2] = ((triplets[:, 1] & 15) << 2) | (triplets[:, 2] >> 6)
+    indices[:, 3] = triplets[:, 2] & 63
+    encoded = _B64_ALPHABET[indices.ravel()]
+    if padding:
+        encoded[-padding:] = ord("=")
+    return encoded.tobytes().decode("ascii")
+
+
+def _waveform_rms_numpy(audio: np.ndarray, step: int, num_points: int) -> np.ndarray:
+    """
+    Computes the scaled RMS amplitude (0-99) of consecutive `step`-sample windows of float32 audio.
+    Args:
+        audio: Mono float32 samples in the range [-1.0, 1.0].
+        step: The number of samples per waveform point.
+        num_points: The number of waveform points; trailing samples beyond `num_points * step` are ignored.
+    Returns:
+        A uint8 array with one value per waveform point.
+    """
+    frames = audio[: num_points * step].reshape(num_points, step)
+    rms_amplitudes = np.sqrt(np.einsum("ij,ij->i", frames, frames) / step)
+    return (np.clip(rms_amplitudes * 3.0, 0.0, 1.0) * 99).astype(np.uint8)
+
+
+def _waveform_rms_loop(audio: np.ndarray, step: int, num_points: int) -> np.ndarray:
+    """
+    Loop form of `_waveform_rms_numpy`, written to be compiled with Numba.
+    """
+    out = np.empty(num_points, dtype=np.uint8)
+    for i in range(num_points):
+        total = 0.0
+        base = i * step
+        for j in range(step):
+            value = audio[base + j]
+            total += value * value
+        rms_amplitude = math.sqrt(total / step)
+        out[i] = int(min(max(rms_amplitude * 3.0, 0.0), 1.0) * 99.0)
+    return out
+
+
+_waveform_rms_compiled: Optional[Any] = None
+_waveform_rms_unavailable = numba is None
+
+
+def _waveform_rms(audio: np.ndarray, step: int, num_points: int) -> np.ndarray:
+    """
+    Computes waveform points with the Numba-compiled loop, compiling it on first use.
+    Falls back to `_waveform_rms_numpy` when Numba is missing or compilation fails.
+    """
+    global _waveform_rms_compiled, _waveform_rms_unavailable
+    if _waveform_rms_compiled is None and not _waveform_rms_unavailable:
+        try:
+            compiled = numba.njit(fastmath=True, cache=True)(_waveform_rms_loop)
+            result = compiled(audio, step, num_points)
+        except Exception as e:
+            _waveform_rms_unavailable = True
+            log.warning(f"Numba compilation of the waveform kernel failed, using NumPy: {e}")
+        else:
+            _waveform_rms_compiled = compiled
+            return result
+    if _waveform_rms_compiled is not None:
+        return _waveform_rms_compiled(audio, step, num_points)
+    return _waveform_rms_numpy(audio, step, num_points)
 
 
 def _get_audio_duration_and_waveform(audio_bytes: bytes, max_waveform_points: int = 100) -> Tuple[float, str]:
@@ -90,38 +373,27 @@ def _get_audio_duration_and_waveform(audio_bytes: bytes, max_waveform_points: in
         A tuple containing the duration of the audio in seconds and the base64 encoded waveform string.
     """
     log.debug("Getting audio duration and waveform")
+    header_duration_secs: Optional[float] = None
     try:
-        with io.BytesIO(audio_bytes) as audio_io:
-            read_result = soundfile.read(audio_io)
-            if read_result is None:
-                log.error("soundfile.read returned None.")
-                return 1.0, DEFAULT_WAVEFORM
-            audio_data, samplerate = read_result
-        if audio_data is None or samplerate is None:
-            log.error("soundfile.read returned None for audio_data or samplerate.")
-            return 1.0, DEFAULT_WAVEFORM
+        with soundfile.SoundFile(io.BytesIO(audio_bytes)) as sound_file:
+            samplerate = sound_file.samplerate
+            header_duration_secs = sound_file.frames / float(samplerate)
+            audio_data = sound_file.read(dtype="float32")
         duration_secs = len(audio_data) / float(samplerate)
-        mono_audio_data = np.mean(audio_data, axis=1) if audio_data.ndim > 1 else audio_data
+        if audio_data.ndim > 1:
+            mono_audio_data = audio_data.sum(axis=1, dtype=np.float32)
+            mono_audio_data *= 1.0 / audio_data.shape[1]
+        else:
+            mono_audio_data = audio_data
         num_samples = len(mono_audio_data)
         if num_samples == 0:
             return duration_secs, DEFAULT_WAVEFORM
-        if not np.issubdtype(mono_audio_data.dtype, np.floating):
-            mono_audio_data = mono_audio_data.astype(np.float32)
         max_abs_val = np.max(np.abs(mono_audio_data))
         if max_abs_val > 1.0:
-            mono_audio_data = mono_audio_data / max_abs_val
+            mono_audio_data *= 1.0 / max_abs_val
         step = max(1, num_samples // max_waveform_points)
-        waveform_raw_bytes = bytearray()
-        for i in range(0, num_samples, step):
-            chunk = mono_audio_data[i : i + step]
-            if len(chunk) == 0:
-                continue
-            rms_amplitude = np.sqrt(np.mean(chunk**2))
-            scaled_value = int(min(max(0, rms_amplitude * 3.0), 1.0) * 99)
-            waveform_raw_bytes.append(scaled_value)
-        if not waveform_raw_bytes:
-            return duration_secs, DEFAULT_WAVEFORM
-        waveform_b64 = base64.b64encode(waveform_raw_bytes).decode("utf-8")
+        waveform_raw_bytes = _waveform_rms(mono_audio_data, step, num_samples // step)
+        waveform_b64 = _encode_waveform_b64(waveform_raw_bytes)
         log.debug(
             "Finished getting audio duration and waveform",
             extra={"duration_secs": duration_secs},
@@ -132,16 +404,58 @@ def _get_audio_duration_and_waveform(audio_bytes: bytes, max_waveform_points: in
             f"Error getting duration/waveform from audio bytes: {e}.",
             exc_info=True,
         )
-        try:
-            with io.BytesIO(audio_bytes) as audio_io_fallback:
-                info = soundfile.info(audio_io_fallback)
-            return info.duration, DEFAULT_WAVEFORM
-        except Exception as e_info:
-            log.error(
-                f"Fallback to get duration from audio bytes also failed. Error: {e_info}",
-                exc_info=True,
-            )
+        if header_duration_secs is None:
+            log.error("Fallback to get duration from the audio header also failed.")
             return 1.0, DEFAULT_WAVEFORM
+        return header_duration_secs, DEFAULT_WAVEFORM
+
+
+def _duration_and_waveform_from_pcm_s16le(
+    pcm_data: _BytesLike, sample_rate: int, max_points: int = 100
+) -> Optional[Tuple[float, str]]:
+    """
+    Calculates the audio duration and a base64 encoded waveform string directly from raw PCM data.
+    This avoids decoding the encoded audio again when the source PCM is still available.
+    Args:
+        pcm_data: The audio data as signed 16-bit little-endian mono PCM.
+        sample_rate: The sample rate of the PCM data in Hz.
+        max_points: The maximum number of points to represent the waveform.
+    Returns:
+        A tuple containing the duration of the audio in seconds and the base64 encoded waveform string,
+        or None if the PCM data could not be analyzed.
+    """
+    log.debug("Getting audio duration and waveform from PCM")
+    try:
+        samples = np.frombuffer(pcm_data, dtype=np.int16)
+        duration_secs = samples.size / float(sample_rate)
+        if samples.size == 0:
+            return duration_secs, DEFAULT_WAVEFORM
+        step = max(1, samples.size // max_points)
+        num_points = samples.size // step
+        audio = samples[: num_points * step].astype(np.float32)
+        audio *= 1.0 / 32768.0
+        waveform_raw_bytes = _waveform_rms(audio, step, num_points)
+        waveform_b64 = _encode_waveform_b64(waveform_raw_bytes)
+        log.debug(
+            "Finished getting audio duration and waveform from PCM",
+            extra={"duration_secs": duration_secs},
+        )
+        return duration_secs, waveform_b64
+    except Exception as e:
+        log.error(f"Error getting duration/waveform from PCM data: {e}.", exc_info=True)
+        return None
+
+
+def _build_speech_config(voice_id: str) -> types.GenerateContentConfig:
+    """
+    Builds the Gemini generation config requesting audio output with the given prebuilt voice.
+    """
+    return types.GenerateContentConfig(
+        response_modalities=["AUDIO"],
+        speech_config=types.SpeechConfig(
+            voice_config=types.VoiceConfig(prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_id))
+        ),
+    )
 
 
 class TTSGenerator(BaseTool):
@@ -151,6 +465,26 @@ class TTSGenerator(BaseTool):
     """
 
     tool_emoji = "🗣️"
+    _FUNCTION_DECLARATIONS = [
+        types.FunctionDeclaration(
+            name="generate_speech_ogg",
+            description="Purpose: This tool serves to transform textual responses into natural-sounding speech, enabling the AI to deliver audible output. This functionality is particularly beneficial for voice-based interactions, enhancing accessibility, and providing a more dynamic user experience. Arguments: `text_for_tts` (string, mandatory) is the exact text to convert into speech. `style` (string, optional) influences vocal characteristics (e.g., tone, emotion) if supported by the underlying TTS model. Results: The function returns the generated speech audio in OGG Opus format, along with its duration in seconds and a base64-encoded waveform string. These results are essential for seamless integration into platforms that support native voice messages, such as Discord, allowing for accurate display of playback length and visual representation of the audio. Notably, the `waveform` generation for Discord native voice messages accurately produces approximately 256 datapoints. Restrictions/Guidelines: Use this tool when the user explicitly requests an audio response, when a response is intended to be spoken rather than read, or in conversational contexts where an audible reply significantly enhances the user experience. When this tool is invoked, any accompanying textual response from the AI will be used as a caption for the audio message; if no text is generated by the AI, no text will be sent. Do not use for purely textual responses or when audio output is unnecessary or redundant.",
+            parameters=types.Schema(
+                type=types.Type.OBJECT,
+                properties={
+                    "text_for_tts": types.Schema(
+                        type=types.Type.STRING,
+                        description="The text to convert to speech.",
+                    ),
+                    "style": types.Schema(
+                        type=types.Type.STRING,
+                        description="Optional style for the voice.",
+                    ),
+                },
+                required=["text_for_tts"],
+            ),
+        )
+    ]
 
     def __init__(self, context: ToolContext):
         """
@@ -160,52 +494,74 @@ class TTSGenerator(BaseTool):
         """
         super().__init__(context)
         self.gemini_core = context.gemini_core
+        self._default_speech_config = _build_speech_config(Settings.VOICE_NAME)
 
     async def synthesize(self, text: str, voice_id: str) -> AsyncGenerator[bytes, None]:
         """
-        Synthesizes speech from text using the Gemini TTS API and yields audio chunks.
+        Synthesizes speech from text using the Gemini TTS API and yields PCM audio chunks as they arrive.
         Args:
             text: The text to convert to speech.
             voice_id: The ID of the voice to use for synthesis.
         Yields:
             Audio data chunks in bytes.
+        Raises:
+            RuntimeError: If the API stops the generation for any reason other than STOP.
         """
         log.debug("Synthesizing speech", extra={"text_len": len(text), "voice_id": voice_id})
         try:
-            speech_generation_config = types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_id)
-                    )
-                ),
-            )
-            log.debug(
-                "Sending TTS synthesis request to Gemini",
-                extra={
-                    "model": Settings.MODEL_ID_TTS,
-                    "contents": [types.Content(parts=[types.Part(text=text)]).model_dump()],
-                    "config": speech_generation_config.model_dump(),
-                },
-            )
+            if voice_id == Settings.VOICE_NAME:
+                speech_generation_config = self._default_speech_config
+            else:
+                speech_generation_config = _build_speech_config(voice_id)
+            contents = [types.Content(parts=[types.Part(text=text)])]
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Sending TTS synthesis request to Gemini",
+                    extra={
+                        "model": Settings.MODEL_ID_TTS,
+                        "contents": [content.model_dump() for content in contents],
+                        "config": speech_generation_config.model_dump(),
+                    },
+                )
+            candidate = None
+            prompt_feedback = None
             async for chunk in await self.gemini_core.generate_content(
                 model=Settings.MODEL_ID_TTS,
-                contents=[types.Content(parts=[types.Part(text=text)])],
+                contents=contents,
                 config=speech_generation_config,
                 stream=True,
             ):
-                log.debug(
-                    "Received TTS synthesis response chunk from Gemini",
-                    extra={"chunk": chunk.model_dump()},
-                )
-                if (
-                    chunk.candidates
-                    and chunk.candidates[0].content
-                    and chunk.candidates[0].content.parts
-                    and chunk.candidates[0].content.parts[0].inline_data
-                    and chunk.candidates[0].content.parts[0].inline_data.data
-                ):
-                    yield chunk.candidates[0].content.parts[0].inline_data.data
+                if chunk.prompt_feedback:
+                    prompt_feedback = chunk.prompt_feedback
+                if not (candidates := chunk.candidates):
+                    continue
+                candidate = candidates[0]
+                if (content := candidate.content) and (parts := content.parts):
+                    for part in parts:
+                        if (inline_data := part.inline_data) and (data := inline_data.data):
+                            if log.isEnabledFor(logging.DEBUG):
+                                log.debug(
+                                    "Received TTS synthesis PCM chunk from Gemini",
+                                    extra={"pcm_len": len(data)},
+                                )
+                            yield data
+                        else:
+                            log.debug("Encountered a part without inline_data.data in Gemini response.")
+            finish_reason = candidate.finish_reason if candidate else None
+            if finish_reason is not None and finish_reason.name == "STOP":
+                return
+            details = ""
+            if candidate is None:
+                reason = "No candidates returned"
+                if prompt_feedback:
+                    details = f"Prompt Feedback: {prompt_feedback}"
+            elif finish_reason is None:
+                reason = "No finish reason provided"
+            else:
+                reason = finish_reason.name
+                if reason == "SAFETY":
+                    details = f"Safety Ratings: {candidate.safety_ratings}"
+            raise RuntimeError(f"TTS generation stopped by API. Finish Reason: {reason}. Details: {details}.")
         except Exception as e:
             log.error(f"Error during TTS synthesis: {e}.", exc_info=True)
             raise
@@ -215,7 +571,8 @@ class TTSGenerator(BaseTool):
     ) -> Optional[Tuple[bytes, float, str]]:
         """
         Generates speech audio in OGG Opus format from text using Gemini TTS.
-        It converts the PCM data from the API response directly to OGG Opus using FFmpeg.
+        It streams the PCM data from the API response into FFmpeg while it is still being generated,
+        and computes the duration and waveform in a worker thread while the encoder finishes.
         Args:
             text_for_tts: The text to convert to speech.
             style: Optional style for the voice (e.g., tone, emotion).
@@ -233,103 +590,42 @@ class TTSGenerator(BaseTool):
         if style:
             text_for_tts = f"{style}: {text_for_tts}"
             log.info(f"Applying style '{style}'. Modified text for TTS: '{text_for_tts}'")
-        speech_generation_config = types.GenerateContentConfig(
-            response_modalities=["AUDIO"],
-            speech_config=types.SpeechConfig(
-                voice_config=types.VoiceConfig(
-                    prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=Settings.VOICE_NAME)
+        pcm_data = bytearray()
+        waveform_task: Optional[asyncio.Task] = None
+
+        async def pcm_chunks() -> AsyncGenerator[bytes, None]:
+            nonlocal waveform_task
+            async for pcm_chunk in self.synthesize(text_for_tts, Settings.VOICE_NAME):
+                pcm_data.extend(pcm_chunk)
+                yield pcm_chunk
+            if pcm_data:
+                waveform_task = asyncio.create_task(
+                    asyncio.to_thread(_duration_and_waveform_from_pcm_s16le, pcm_data, _TTS_PCM_SAMPLE_RATE, 256)
                 )
-            ),
-        )
-        log.debug(
-            "Sending TTS generation request to Gemini",
-            extra={
-                "model": Settings.MODEL_ID_TTS,
-                "contents": [types.Content(parts=[types.Part(text=text_for_tts)]).model_dump()],
-                "config": speech_generation_config.model_dump(),
-            },
-        )
-        gemini_response_object = await self.gemini_core.generate_content(
-            model=Settings.MODEL_ID_TTS,
-            contents=[types.Content(parts=[types.Part(text=text_for_tts)])],
-            config=speech_generation_config,
-        )
-        log.debug(
-            "Received TTS generation response from Gemini",
-            extra={"response": gemini_response_object.model_dump()},
-        )
-        reason = "Unknown"
-        details = ""
-        candidate = None
-        if not gemini_response_object.candidates:
-            reason = "No candidates returned"
-            if gemini_response_object.prompt_feedback:
-                details = f"Prompt Feedback: {gemini_response_object.prompt_feedback}"
-        else:
-            candidate = gemini_response_object.candidates[0]
-            finish_reason = candidate.finish_reason
-            if finish_reason is None:
-                reason = "No finish reason provided"
-            elif finish_reason.name != "STOP":
-                reason = finish_reason.name
-                if finish_reason.name == "SAFETY":
-                    details = f"Safety Ratings: {candidate.safety_ratings}"
-        if candidate is None or (candidate.finish_reason is None or candidate.finish_reason.name != "STOP"):
-            log.error(f"TTS generation stopped by API. Finish Reason: {reason}. Details: {details}.")
-            return None
-        pcm_data_chunks = []
-        if not (
-            gemini_response_object.candidates
-            and gemini_response_object.candidates[0].content
-            and gemini_response_object.candidates[0].content.parts
-        ):
-            log.error(f"No audio data parts found in the Gemini response for model {Settings.MODEL_ID_TTS}.")
-            return None
-        for part in gemini_response_object.candidates[0].content.parts:
-            if part.inline_data and part.inline_data.data:
-                pcm_data_chunks.append(part.inline_data.data)
+
+        try:
+            if av is not None:
+                ogg_opus_bytes = await _encode_opus_in_process(pcm_chunks(), _TTS_PCM_SAMPLE_RATE)
+                stderr, return_code = None, 0
             else:
-                log.debug("Encountered a part without inline_data.data in Gemini response.")
-        if not pcm_data_chunks:
+                ogg_opus_bytes, stderr, return_code = await _execute_ffmpeg(_TTS_FFMPEG_ARGS, pcm_chunks())
+        except Exception as e:
+            if waveform_task:
+                waveform_task.cancel()
+            log.error(f"Speech synthesis or FFmpeg conversion failed: {e}.", exc_info=True)
+            return None
+        if not pcm_data or waveform_task is None:
             log.warning(f"No PCM data was received from Gemini for model {Settings.MODEL_ID_TTS}.")
             return None
-        pcm_data = b"".join(pcm_data_chunks)
-        pcm_format = "s16le"
-        input_args = [
-            "-ar",
-            "24000",
-            "-ac",
-            "1",
-        ]
-        output_args = [
-            "-c:a",
-            "libopus",
-            "-b:a",
-            "64k",
-            "-ar",
-            "48000",
-            "-ac",
-            "1",
-            "-application",
-            "voip",
-            "-vbr",
-            "on",
-        ]
-        try:
-            ogg_opus_bytes = await _convert_audio(
-                input_data=pcm_data,
-                input_format=pcm_format,
-                output_format="opus",
-                input_args=input_args,
-                output_args=output_args,
-            )
-            if not ogg_opus_bytes:
-                log.error("FFmpeg conversion produced no output.")
-                return None
-        except Exception as e:
-            log.error(f"FFmpeg conversion failed: {e}.", exc_info=True)
+        if return_code != 0 or not ogg_opus_bytes:
+            waveform_task.cancel()
+            error_msg = stderr.decode(errors="ignore") if stderr else "Unknown error"
+            log.error(f"Audio conversion failed with code {return_code}: {error_msg}")
             return None
-        duration_secs, waveform_b64 = _get_audio_duration_and_waveform(ogg_opus_bytes, max_waveform_points=256)
+        waveform_info = await waveform_task
+        if waveform_info is None:
+            waveform_info = await asyncio.to_thread(_get_audio_duration_and_waveform, ogg_opus_bytes, 256)
+        duration_secs, waveform_b64 = waveform_info
         log.info(f"Successfully generated speech audio ({duration_secs:.2f}s)")
         return ogg_opus_bytes, duration_secs, waveform_b64
 
@@ -338,26 +634,7 @@ class TTSGenerator(BaseTool):
         Returns the function declarations for the `generate_speech_ogg` function.
         This function is exposed to the Gemini model to allow it to generate speech.
         """
-        return [
-            types.FunctionDeclaration(
-                name="generate_speech_ogg",
-                description="Purpose: This tool serves to transform textual responses into natural-sounding speech, enabling the AI to deliver audible output. This functionality is particularly beneficial for voice-based interactions, enhancing accessibility, and providing a more dynamic user experience. Arguments: `text_for_tts` (string, mandatory) is the exact text to convert into speech. `style` (string, optional) influences vocal characteristics (e.g., tone, emotion) if supported by the underlying TTS model. Results: The function returns the generated speech audio in OGG Opus format, along with its duration in seconds and a base64-encoded waveform string. These results are essential for seamless integration into platforms that support native voice messages, such as Discord, allowing for accurate display of playback length and visual representation of the audio. Notably, the `waveform` generation for Discord native voice messages accurately produces approximately 256 datapoints. Restrictions/Guidelines: Use this tool when the user explicitly requests an audio response, when a response is intended to be spoken rather than read, or in conversational contexts where an audible reply significantly enhances the user experience. When this tool is invoked, any accompanying textual response from the AI will be used as a caption for the audio message; if no text is generated by the AI, no text will be sent. Do not use for purely textual responses or when audio output is unnecessary or redundant.",
-                parameters=types.Schema(
-                    type=types.Type.OBJECT,
-                    properties={
-                        "text_for_tts": types.Schema(
-                            type=types.Type.STRING,
-                            description="The text to convert to speech.",
-                        ),
-                        "style": types.Schema(
-                            type=types.Type.STRING,
-                            description="Optional style for the voice.",
-                        ),
-                    },
-                    required=["text_for_tts"],
-                ),
-            )
-        ]
+        return list(self._FUNCTION_DECLARATIONS)
 
     async def execute_tool(self, function_name: str, args: Dict[str, Any], context: ToolContext) -> types.Part:
         """
@@ -5,6 +5,7 @@ import os
 import discord
 from discord.ext import commands
 
+from ai.tools.tts import close_ffmpeg_pool
 from bot.core.container import Container
 from bot.core.handlers import BotHandlers
 from settings import Settings
@@ -43,7 +44,8 @@ async def run():
     )
     log.debug("Discord bot object created.")
     container = Container(settings)
-    scraper = container.get("scraper")
+    container.eager_init()
+    scraper = container.scraper
     log.debug("DI container and scraper initialized.")
     try:
         async with scraper:
@@ -51,14 +53,15 @@ async def run():
             await bot.add_cog(
                 BotHandlers(
                     bot,
-                    container.get("request_manager"),
-                    container.get("discord_event_handler"),
+                    container.request_manager,
+                    container.discord_event_handler,
                     settings,
-                    container.get("message_parser"),
+                    container.message_parser,
+                    container.reaction_manager,
                 )
             )
             log.info("Attempting to connect to Discord and start bot.")
-            message_queue = container.get("message_queue")
+            message_queue = container.message_queue
             message_queue.start_workers()
             await bot.start(settings.DISCORD_BOT_TOKEN)
     except Exception as e:
@@ -69,10 +72,14 @@ async def run():
             log.debug("Closing scraper.")
             await scraper.close()
         try:
-            message_queue = container.get("message_queue")
+            message_queue = container.message_queue
             await message_queue.stop_workers()
         except Exception:
             pass
+        try:
+            await close_ffmpeg_pool()
+        except Exception as e:
+            log.warning(f"Failed to close FFmpeg process pool: {e}")
         try:
             if os.path.exists(signal_path):
                 os.remove(signal_path)
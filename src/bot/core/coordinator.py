@@ -20,6 +20,10 @@ from scraper.orchestrator import ScrapingOrchestrator
 log = logging.getLogger("Bard")
 
 
+class _Cancelled(BaseException):
+    """Raised inside `Coordinator.process` to stop work on a cancelled request."""
+
+
 class Coordinator:
     """
     Orchestrates the high-level workflow for processing a single Discord message.
@@ -27,6 +31,17 @@ class Coordinator:
     message sending, and task lifecycle management.
     """
 
+    __slots__ = (
+        "message_parser",
+        "ai_conversation",
+        "message_queue",
+        "request_manager",
+        "reaction_manager",
+        "scraping_orchestrator",
+        "typing_manager",
+        "chat_session_manager",
+    )
+
     def __init__(
         self,
         message_parser: MessageParser,
@@ -75,129 +90,165 @@ class Coordinator:
             reaction_to_remove: Optional tuple containing a Reaction and User to remove after processing.
         """
         from log import set_request_log_file
-        set_request_log_file(request.id)
-        if reaction_to_remove:
-            await self.reaction_manager.remove_reaction(reaction_to_remove)
+        request_id = request.id
         message: Message = request.message
+        message_id = message.id
+        channel = message.channel
+        update_state = self.request_manager.update_request_state
+        reaction_manager = self.reaction_manager
+        set_request_log_file(request_id)
+        remove_reaction_task = (
+            asyncio.create_task(reaction_manager.remove_reaction(reaction_to_remove))
+            if reaction_to_remove
+            else None
+        )
         log.info(
             "Starting message processing.",
             extra={
-                "request_id": request.id,
-                "message_id": message.id,
+                "request_id": request_id,
+                "message_id": message_id,
                 "user_id": message.author.id,
             },
         )
-        self.request_manager.update_request_state(request.id, RequestState.PROCESSING)
-        final_ai_response: Optional[FinalAIResponse] = None
+        update_state(request_id, RequestState.PROCESSING)
+        debug = log.isEnabledFor(logging.DEBUG)
+        completion_task: Optional[asyncio.Task] = None
         try:
-            self.typing_manager.start_typing(message.channel)
-            if request.state == RequestState.CANCELLED:
-                log.info(f"Request {request.id} was cancelled before processing.")
-                return
-            log.debug("Parsing message content.", extra={"message_id": message.id})
-            parsed_context: ParsedMessageContext = await self.message_parser.parse(message)
-            request.context = parsed_context
-            log.debug(
-                "Message parsed successfully.",
-                extra={"message_id": message.id, "context": parsed_context},
-            )
-            if request.state == RequestState.CANCELLED:
-                log.info(f"Request {request.id} was cancelled after parsing.")
-                return
-            log.debug("Starting AI conversation.", extra={"message_id": message.id})
-            chat_session = await self.chat_session_manager.get_or_create_session(message)
+            async with self.typing_manager.typing_for(channel):
+                try:
+                    if request.state is RequestState.CANCELLED:
+                        raise _Cancelled("before processing")
+                    if debug:
+                        log.debug("Parsing message content.", extra={"message_id": message_id})
+                    parsed_context: ParsedMessageContext = await self.message_parser.parse(message)
+                    request.context = parsed_context
+                    if debug:
+                        log.debug(
+                            "Message parsed successfully.",
+                            extra={"message_id": message_id, "context": parsed_context},
+                        )
+                    if request.state is RequestState.CANCELLED:
+                        raise _Cancelled("after parsing")
+                    if debug:
+                        log.debug("Starting AI conversation.", extra={"message_id": message_id})
+                    chat_session = await self.chat_session_manager.get_or_create_session(message)
 
-            @async_retry(retry_on=(genai_errors.ServerError,))
-            async def run_ai_conversation():
-                return await self.ai_conversation.run(parsed_context, chat_session)
+                    @async_retry(retry_on=(genai_errors.ServerError,))
+                    async def run_ai_conversation():
+                        return await self.ai_conversation.run(parsed_context, chat_session)
 
-            final_ai_response = await run_ai_conversation()
-            log.debug(
-                "AI conversation completed.",
-                extra={"message_id": message.id, "response": final_ai_response},
-            )
-            if request.state == RequestState.CANCELLED:
-                log.info(f"Request {request.id} was cancelled after AI conversation.")
-                return
-            log.debug("Enqueuing AI response.", extra={"message_id": message.id})
-            await self.message_queue.enqueue(
-                channel_id=message.channel.id,
-                message_data={
-                    "message_to_reply_to": message,
-                    "text_content": final_ai_response.text_content,
-                    "existing_bot_messages_to_edit": bot_messages_to_edit,
-                    **final_ai_response.media,
-                    "tool_emojis": final_ai_response.tool_emojis,
-                },
-                request=request,
-            )
-            log.info(
-                "AI response enqueued.",
-                extra={
-                    "message_id": message.id,
-                },
-            )
-            if final_ai_response:
-                bot_messages = None
-                try:
-                    await asyncio.wait_for(request.messages_ready.wait(), timeout=5.0)
-                    bot_messages = request.bot_messages
-                    log.debug(f"Bot messages received via event: {bot_messages}")
-                except asyncio.TimeoutError:
-                    log.warning("Timed out waiting for bot messages to be populated in request.")
-                if bot_messages and bot_messages[0]:
-                    await self.chat_session_manager.update_leaf_for_message(
-                        user_message_id=message.id, bot_message_id=bot_messages[0].id
+                    final_ai_response: FinalAIResponse = await run_ai_conversation()
+                    if debug:
+                        log.debug(
+                            "AI conversation completed.",
+                            extra={"message_id": message_id, "response": final_ai_response},
+                        )
+                    if request.state is RequestState.CANCELLED:
+                        raise _Cancelled("after AI conversation")
+                    tool_emojis = final_ai_response.tool_emojis
+                    if debug:
+                        log.debug("Enqueuing AI response.", extra={"message_id": message_id})
+                    await self.message_queue.enqueue(
+                        channel_id=channel.id,
+                        message_data={
+                            "message_to_reply_to": message,
+                            "text_content": final_ai_response.text_content,
+                            "existing_bot_messages_to_edit": bot_messages_to_edit,
+                            **final_ai_response.media,
+                            "tool_emojis": tool_emojis,
+                        },
+                        request=request,
+                    )
+                    log.info(
+                        "AI response enqueued.",
+                        extra={
+                            "message_id": message_id,
+                        },
+                    )
+                    bot_messages = None
+                    try:
+                        await asyncio.wait_for(request.messages_ready.wait(), timeout=5.0)
+                        bot_messages = request.bot_messages
+                        if debug:
+                            log.debug("Bot messages received via event: %s", bot_messages)
+                    except asyncio.TimeoutError:
+                        log.warning("Timed out waiting for bot messages to be populated in request.")
+                    if request.cancel_emoji_added or request.bot_messages:
+                        completion_task = asyncio.create_task(
+                            reaction_manager.handle_request_completion(request, tool_emojis)
+                        )
+                    if bot_messages and bot_messages[0]:
+                        await self.chat_session_manager.update_leaf_for_message(
+                            user_message_id=message_id, bot_message_id=bot_messages[0].id
+                        )
+                    update_state(request_id, RequestState.DONE)
+                except _Cancelled as stage:
+                    log.info("Request %s was cancelled %s.", request_id, stage)
+                except genai_errors.ServerError as e:
+                    await self._handle_error(
+                        request,
+                        bot_messages_to_edit,
+                        "Google API server error during message processing.",
+                        e,
+                        "The model is currently overloaded. Please try again shortly.",
+                    )
+                except Exception as e:
+                    await self._handle_error(
+                        request,
+                        bot_messages_to_edit,
+                        "Unhandled error during message processing.",
+                        e,
+                        f"An error occurred while processing your request.\n```\n{e}\n```",
                     )
-                await self.reaction_manager.handle_request_completion(request, final_ai_response.tool_emojis)
-            self.request_manager.update_request_state(request.id, RequestState.DONE)
-        except genai_errors.ServerError as e:
-            self.request_manager.update_request_state(request.id, RequestState.ERROR)
-            log.error(
-                "Google API server error during message processing.",
-                extra={
-                    "request_id": request.id,
-                    "message_id": message.id,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            error_message = "The model is currently overloaded. Please try again shortly."
-            await self.message_queue.enqueue(
-                channel_id=message.channel.id,
-                message_data={
-                    "message_to_reply_to": message,
-                    "text_content": error_message,
-                    "existing_bot_messages_to_edit": bot_messages_to_edit,
-                },
-                request=request,
-            )
-            await self.reaction_manager.handle_request_error(request)
-        except Exception as e:
-            self.request_manager.update_request_state(request.id, RequestState.ERROR)
-            log.error(
-                "Unhandled error during message processing.",
-                extra={
-                    "request_id": request.id,
-                    "message_id": message.id,
-                    "error": str(e),
-                },
-                exc_info=True,
-            )
-            error_message = f"An error occurred while processing your request.\n```\n{e}\n```"
-            await self.message_queue.enqueue(
-                channel_id=message.channel.id,
-                message_data={
-                    "message_to_reply_to": message,
-                    "text_content": error_message,
-                    "existing_bot_messages_to_edit": bot_messages_to_edit,
-                },
-                request=request,
-            )
-            await self.reaction_manager.handle_request_error(request)
         finally:
-            self.typing_manager.stop_typing(message.channel)
+            pending = [task for task in (remove_reaction_task, completion_task) if task]
+            if pending:
+                for result in await asyncio.gather(*pending, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        log.warning(
+                            "Reaction update failed after processing.",
+                            extra={"request_id": request_id, "error": str(result)},
+                        )
             log.info(
                 "Finished message processing.",
-                extra={"request_id": request.id, "message_id": message.id},
+                extra={"request_id": request_id, "message_id": message_id},
             )
+
+    async def _handle_error(
+        self,
+        request: Request,
+        bot_messages_to_edit: Optional[List[Message]],
+        log_message: str,
+        error: Exception,
+        error_text: str,
+    ) -> None:
+        """
+        Marks a request as failed, logs the error and replies with an error message.
+        Args:
+            request: The request that failed.
+            bot_messages_to_edit: Optional list of bot messages that can be edited.
+            log_message: The message to log alongside the error.
+            error: The exception that caused the failure.
+            error_text: The text sent back to the user.
+        """
+        message = request.message
+        self.request_manager.update_request_state(request.id, RequestState.ERROR)
+        log.error(
+            log_message,
+            extra={
+                "request_id": request.id,
+                "message_id": message.id,
+                "error": str(error),
+            },
+            exc_info=error,
+        )
+        await self.message_queue.enqueue(
+            channel_id=message.channel.id,
+            message_data={
+                "message_to_reply_to": message,
+                "text_content": error_text,
+                "existing_bot_messages_to_edit": bot_messages_to_edit,
+            },
+            request=request,
+        )
+        await self.reaction_manager.handle_request_error(request)
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import List, Optional, Tuple
+from datetime import timedelta
+from typing import Dict, List, Optional, Tuple
 
 import discord
 from discord import Message, Reaction, User
@@ -14,6 +15,9 @@ from settings import Settings
 
 log = logging.getLogger("Bard")
 
+_BULK_DELETE_LIMIT = 100
+_BULK_DELETE_MAX_AGE = timedelta(days=14)
+
 
 class DiscordEventHandler:
     """
@@ -49,6 +53,19 @@ class DiscordEventHandler:
         self.bot_user_id = bot_user_id
         log.debug("DiscordEventHandler initialized.")
 
+    def tracks_message(self, message_id: int) -> bool:
+        """
+        Checks whether a message is a user message or bot response belonging to a tracked request.
+        Args:
+            message_id: The ID of the Discord message.
+        Returns:
+            True if any tracked request is associated with the message.
+        """
+        return bool(
+            self.request_manager.get_request_by_bot_message_id(message_id)
+            or self.request_manager.get_requests_by_message_id(message_id)
+        )
+
     async def _start_new_request(
         self,
         message: Message,
@@ -57,9 +74,77 @@ class DiscordEventHandler:
     ):
         request = self.request_manager.create_request(message=message, original_message_id=message.id)
         await self.reaction_manager.handle_request_creation(request)
-        task = asyncio.create_task(self.coordinator.process(request, bot_messages_to_edit, reaction_to_remove))
-        self.request_manager.assign_task_to_request(request.id, task)
-        log.debug(f"Started processing request {request.id} for message {message.id}")
+        self.request_manager.start_request_task(
+            request, self.coordinator.process(request, bot_messages_to_edit, reaction_to_remove)
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Started processing request %s for message %s", request.id, message.id)
+
+    async def _delete_bot_responses(self, responses: List[Message]):
+        """
+        Deletes a request's bot responses. If the first response started a thread, only that
+        message is deleted; otherwise every response is deleted once.
+        Args:
+            responses: The bot messages to delete.
+        """
+        first_message = responses[0]
+        if first_message.thread:
+            try:
+                await first_message.delete()
+            except discord.HTTPException as e:
+                log.warning(
+                    "Could not delete bot thread starter.",
+                    extra={"message_id": first_message.id, "error": e},
+                )
+            return
+        unique_responses = list({response.id: response for response in responses}.values())
+        await self._delete_messages(unique_responses)
+
+    async def _delete_messages(self, messages: List[Message]):
+        """
+        Deletes the given messages, logging any that could not be deleted.
+        Recent guild messages sharing a channel are removed with a single bulk delete
+        where the bot is allowed to; the rest are deleted concurrently one by one.
+        Args:
+            messages: The Discord messages to delete.
+        """
+        cutoff = discord.utils.utcnow() - _BULK_DELETE_MAX_AGE
+        bulk_groups: Dict[int, List[Message]] = {}
+        individual: List[Message] = []
+        for message in messages:
+            channel = message.channel
+            if (
+                message.guild
+                and message.created_at > cutoff
+                and isinstance(channel, (discord.TextChannel, discord.Thread, discord.VoiceChannel))
+                and channel.permissions_for(message.guild.me).manage_messages
+            ):
+                bulk_groups.setdefault(channel.id, []).append(message)
+            else:
+                individual.append(message)
+        for group in bulk_groups.values():
+            if len(group) < 2:
+                individual.extend(group)
+                continue
+            for start in range(0, len(group), _BULK_DELETE_LIMIT):
+                batch = group[start : start + _BULK_DELETE_LIMIT]
+                try:
+                    await batch[0].channel.delete_messages(batch)
+                except discord.HTTPException as e:
+                    log.warning(
+                        "Bulk delete failed, deleting messages individually.",
+                        extra={"channel_id": batch[0].channel.id, "error": e},
+                    )
+                    individual.extend(batch)
+        results = await asyncio.gather(*(message.delete() for message in individual), return_exceptions=True)
+        for message, result in zip(individual, results, strict=True):
+            if isinstance(result, discord.HTTPException):
+                log.warning(
+                    "Could not delete bot response.",
+                    extra={"message_id": message.id, "error": result},
+                )
+            elif isinstance(result, BaseException):
+                raise result
 
     async def handle_edit(self, before: Message, after: Message):
         """
@@ -71,31 +156,30 @@ class DiscordEventHandler:
             before: The message object before the edit.
             after: The message object after the edit.
         """
-        if before.content == after.content and not before.embeds and after.embeds:
-            log.debug(
-                "Ignoring message edit due to embed-only change.",
-                extra={"message_id": after.id},
-            )
+        if (before.content or "").strip() == (after.content or "").strip() and [
+            attachment.id for attachment in before.attachments
+        ] == [attachment.id for attachment in after.attachments]:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Ignoring message edit without a content or attachment change.",
+                    extra={"message_id": after.id},
+                )
             return
-        for request in self.request_manager._requests.values():
-            if request.original_message_id == after.id:
-                await self.request_manager.cancel_request(request.id, is_edit=True)
+        matching_requests = self.request_manager.get_requests_by_message_id(after.id)
+        existing_bot_responses = next(
+            (request.bot_messages for request in matching_requests if request.bot_messages),
+            None,
+        )
+        for request in matching_requests:
+            await self.request_manager.cancel_request(request.id, is_edit=True)
         is_dm = isinstance(after.channel, discord.DMChannel)
         is_mentioned = False
-        if after.guild:
-            if self.bot_user_id is not None:
+        if after.guild and self.bot_user_id is not None:
+            is_mentioned = any(user.id == self.bot_user_id for user in after.mentions)
+            if not is_mentioned and (after.mention_everyone or after.role_mentions):
                 member = after.guild.get_member(self.bot_user_id)
-            else:
-                member = None
-            if member:
-                is_mentioned = member.mentioned_in(after)
+                is_mentioned = bool(member and member.mentioned_in(after))
         should_process_after = is_dm or is_mentioned
-        existing_bot_responses = None
-        for request in self.request_manager._requests.values():
-            if request.original_message_id == after.id:
-                if request.bot_messages:
-                    existing_bot_responses = request.bot_messages
-                    break
         if not should_process_after and existing_bot_responses:
             should_process_after = True
         if not should_process_after:
@@ -104,24 +188,7 @@ class DiscordEventHandler:
                     "Message is no longer relevant, deleting previous bot responses.",
                     extra={"message_id": after.id},
                 )
-                first_message = existing_bot_responses[0]
-                if first_message.thread:
-                    try:
-                        await first_message.delete()
-                    except discord.HTTPException as e:
-                        log.warning(
-                            "Could not delete previous bot thread starter.",
-                            extra={"message_id": first_message.id, "error": e},
-                        )
-                else:
-                    for msg in existing_bot_responses:
-                        try:
-                            await msg.delete()
-                        except discord.HTTPException as e:
-                            log.warning(
-                                "Could not delete previous bot response.",
-                                extra={"message_id": msg.id, "error": e},
-                            )
+                await self._delete_bot_responses(existing_bot_responses)
             return
         log.info(
             "Starting new request for edited message.",
@@ -143,36 +210,19 @@ class DiscordEventHandler:
         )
         requests_to_cancel = []
         bot_responses_to_delete = []
-        for request in self.request_manager._requests.values():
-            if request.original_message_id == message.id:
-                requests_to_cancel.append(request.id)
-                if request.bot_messages:
-                    bot_responses_to_delete.extend(request.bot_messages)
+        for request in self.request_manager.get_requests_by_message_id(message.id):
+            requests_to_cancel.append(request.id)
+            if request.bot_messages:
+                bot_responses_to_delete.extend(request.bot_messages)
         for request_id in requests_to_cancel:
             await self.request_manager.cancel_request(request_id)
+            self.request_manager.forget_request(request_id)
         if bot_responses_to_delete:
             log.info(
                 "Deleting bot responses associated with deleted message.",
                 extra={"message_id": message.id},
             )
-            first_message = bot_responses_to_delete[0]
-            if first_message.thread:
-                try:
-                    await first_message.delete()
-                except discord.HTTPException as e:
-                    log.warning(
-                        "Could not delete bot thread starter.",
-                        extra={"message_id": first_message.id, "error": e},
-                    )
-            else:
-                for bot_response in bot_responses_to_delete:
-                    try:
-                        await bot_response.delete()
-                    except discord.HTTPException as e:
-                        log.warning(
-                            "Could not delete bot response.",
-                            extra={"message_id": bot_response.id, "error": e},
-                        )
+            await self._delete_bot_responses(bot_responses_to_delete)
 
     async def handle_retry_reaction(self, reaction: Reaction, user: User):
         """
@@ -180,37 +230,36 @@ class DiscordEventHandler:
         If the reaction is the configured retry emoji on a bot's message, and the reactor
         is the original author of the message that the bot replied to,
         the original message is reprocessed.
+        The caller dispatches by emoji, so the reaction is known to be the retry emoji.
         Args:
             reaction: The Discord Reaction object.
             user: The Discord User who added the reaction.
         """
-        if user.bot or str(reaction.emoji) != self.settings.RETRY_EMOJI:
+        if user.bot:
             return
-        log.debug(
-            "Handling retry reaction.",
-            extra={
-                "message_id": reaction.message.id,
-                "user_id": user.id,
-                "emoji": str(reaction.emoji),
-            },
-        )
         request_to_retry = None
         if reaction.message.author.id == self.bot_user_id:
-            for request in self.request_manager._requests.values():
-                if request.bot_messages and any(m.id == reaction.message.id for m in request.bot_messages):
-                    request_to_retry = request
-                    break
+            request_to_retry = self.request_manager.get_request_by_bot_message_id(reaction.message.id)
         else:
-            for request in self.request_manager._requests.values():
-                if request.original_message_id == reaction.message.id:
-                    request_to_retry = request
-                    break
+            matching_requests = self.request_manager.get_requests_by_message_id(reaction.message.id)
+            if matching_requests:
+                request_to_retry = matching_requests[0]
         if not request_to_retry:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "No active request found for this reaction.",
+                    extra={"message_id": reaction.message.id},
+                )
+            return
+        if log.isEnabledFor(logging.DEBUG):
             log.debug(
-                "No active request found for this reaction.",
-                extra={"message_id": reaction.message.id},
+                "Handling retry reaction.",
+                extra={
+                    "request_id": request_to_retry.id,
+                    "message_id": reaction.message.id,
+                    "user_id": user.id,
+                },
             )
-            return
         try:
             original_message = await reaction.message.channel.fetch_message(request_to_retry.original_message_id)
         except discord.HTTPException as e:
@@ -253,28 +302,25 @@ class DiscordEventHandler:
         If the reaction is the configured cancel emoji on a user's message
         that the bot is currently processing, and the reactor is the author
         of that message, the processing task is cancelled.
+        The caller dispatches by emoji, so the reaction is known to be the cancel emoji.
         Args:
             reaction: The Discord Reaction object.
             user: The Discord User who added the reaction.
         """
-        if user.bot:
+        if user.bot or reaction.message.author.id != user.id:
             return
-        if str(reaction.emoji) == self.settings.CANCEL_EMOJI:
-            request_to_cancel = None
-            for request in self.request_manager._requests.values():
-                if request.original_message_id == reaction.message.id and request.state in (
-                    RequestState.PENDING,
-                    RequestState.PROCESSING,
-                ):
-                    request_to_cancel = request
-                    break
-            if request_to_cancel and reaction.message.author.id == user.id:
-                log.info(
-                    "Cancel reaction detected, cancelling request.",
-                    extra={
-                        "request_id": request_to_cancel.id,
-                        "message_id": reaction.message.id,
-                        "user_id": user.id,
-                    },
-                )
-                await self.request_manager.cancel_request(request_to_cancel.id)
+        request_to_cancel = None
+        for request in self.request_manager.get_requests_by_message_id(reaction.message.id):
+            if request.state in (RequestState.PENDING, RequestState.PROCESSING):
+                request_to_cancel = request
+                break
+        if request_to_cancel:
+            log.info(
+                "Cancel reaction detected, cancelling request.",
+                extra={
+                    "request_id": request_to_cancel.id,
+                    "message_id": reaction.message.id,
+                    "user_id": user.id,
+                },
+            )
+            await self.request_manager.cancel_request(request_to_cancel.id)
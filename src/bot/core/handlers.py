@@ -1,13 +1,15 @@
 import logging
+import os
 
 import discord
-from discord import Message, Reaction, User
+from discord import Message
 from discord.ext import commands
 
 from bot.core.events import DiscordEventHandler
 from bot.core.lifecycle import RequestManager
 from bot.core.presence import PresenceManager
 from bot.message.parser import MessageParser
+from bot.message.reactions import ReactionManager
 from settings import Settings
 
 log = logging.getLogger("Bard")
@@ -26,6 +28,7 @@ class BotHandlers(commands.Cog):
         discord_event_handler: DiscordEventHandler,
         settings: Settings,
         message_parser: MessageParser,
+        reaction_manager: ReactionManager,
     ):
         """
         Initializes the BotHandlers cog.
@@ -35,13 +38,17 @@ class BotHandlers(commands.Cog):
             discord_event_handler: Handles Discord-specific events.
             settings: Application configuration settings.
             message_parser: Parses Discord messages into structured data.
+            reaction_manager: Manages reactions that reflect the request lifecycle.
         """
         self.bot = bot
         self.request_manager = request_manager
         self.discord_event_handler = discord_event_handler
         self.settings = settings
         self.message_parser = message_parser
+        self.reaction_manager = reaction_manager
         self.presence_manager = PresenceManager(bot, settings)
+        self._retry_emoji = settings.RETRY_EMOJI
+        self._cancel_emoji = settings.CANCEL_EMOJI
         log.debug("BotHandlers cog initialized.")
 
     @commands.Cog.listener()
@@ -73,11 +80,9 @@ class BotHandlers(commands.Cog):
             )
             self.discord_event_handler.bot_user_id = self.bot.user.id
             self.message_parser.bot_user_id = self.bot.user.id
+            self.reaction_manager.bot_user_id = self.bot.user.id
             log.debug(f"Bot user ID set to {self.bot.user.id}.")
-            await self.presence_manager.set_presence()
             try:
-                import os
-
                 signal_path = os.path.join(self.settings.CACHE_DIR, "bot_ready")
                 os.makedirs(os.path.dirname(signal_path), exist_ok=True)
                 with open(signal_path, "w") as f:
@@ -85,6 +90,7 @@ class BotHandlers(commands.Cog):
                 log.debug(f"Readiness signal file ({signal_path}) created.")
             except Exception as e:
                 log.error(f"Failed to create readiness signal file: {e}")
+            await self.presence_manager.set_presence()
         else:
             log.warning("Bot user is not available on on_ready event.")
 
@@ -101,7 +107,8 @@ class BotHandlers(commands.Cog):
         if message.author == self.bot.user:
             return
         if message.author.bot and message.author.id not in self.settings.ALLOWED_BOT_IDS:
-            log.debug(f"Ignoring message from bot: {message.author.name} ({message.author.id})")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Ignoring message from bot: %s (%s)", message.author.name, message.author.id)
             return
         is_dm = isinstance(message.channel, discord.DMChannel)
         is_mentioned = self.bot.user.mentioned_in(message) if message.guild else False
@@ -127,10 +134,11 @@ class BotHandlers(commands.Cog):
         assert self.bot.user is not None, "Bot user not initialized."
         if after.author == self.bot.user or after.author.bot:
             return
-        log.debug(
-            "Message edit detected.",
-            extra={"message_id": after.id, "user_id": after.author.id},
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Message edit detected.",
+                extra={"message_id": after.id, "user_id": after.author.id},
+            )
         await self.discord_event_handler.handle_edit(before, after)
 
     @commands.Cog.listener()
@@ -140,30 +148,56 @@ class BotHandlers(commands.Cog):
         Args:
             message: The Discord message object that was deleted.
         """
-        log.debug(
-            "Message delete detected.",
-            extra={"message_id": message.id, "user_id": message.author.id},
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Message delete detected.",
+                extra={"message_id": message.id, "user_id": message.author.id},
+            )
         await self.discord_event_handler.handle_delete(message)
 
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction: Reaction, user: User):
+    async def on_raw_reaction_add(self, payload: discord.RawReactionActionEvent):
         """
-        Handles the 'on_reaction_add' event, delegating to DiscordEventHandler.
+        Handles the 'on_raw_reaction_add' event, delegating to DiscordEventHandler.
+        Unlike 'on_reaction_add', this fires for messages outside the client's message cache.
+        The message and user are only resolved once the reaction is known to target a tracked request.
         Args:
-            reaction: The Discord Reaction object.
-            user: The Discord User who added the reaction.
+            payload: The raw reaction event payload.
         """
         assert self.bot.user is not None, "Bot user not initialized."
-        if user.id == self.bot.user.id:
+        if payload.user_id == self.bot.user.id:
+            return
+        emoji = str(payload.emoji)
+        if emoji == self._retry_emoji:
+            handler = self.discord_event_handler.handle_retry_reaction
+        elif emoji == self._cancel_emoji:
+            handler = self.discord_event_handler.handle_cancel_reaction
+        else:
+            return
+        if not self.discord_event_handler.tracks_message(payload.message_id):
+            return
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "Reaction added.",
+                extra={
+                    "message_id": payload.message_id,
+                    "emoji": emoji,
+                    "user_id": payload.user_id,
+                },
+            )
+        try:
+            message = discord.utils.get(self.bot.cached_messages, id=payload.message_id)
+            if message is None:
+                channel = self.bot.get_channel(payload.channel_id) or await self.bot.fetch_channel(payload.channel_id)
+                message = await channel.fetch_message(payload.message_id)  # type: ignore
+            user = payload.member or self.bot.get_user(payload.user_id) or await self.bot.fetch_user(payload.user_id)
+        except discord.HTTPException as e:
+            log.warning(
+                "Failed to resolve reaction target.",
+                extra={"message_id": payload.message_id, "error": e},
+            )
+            return
+        reaction = next((r for r in message.reactions if str(r.emoji) == emoji), None)
+        if reaction is None:
             return
-        log.debug(
-            "Reaction added.",
-            extra={
-                "message_id": reaction.message.id,
-                "emoji": str(reaction.emoji),
-                "user_id": user.id,
-            },
-        )
-        await self.discord_event_handler.handle_retry_reaction(reaction, user)
-        await self.discord_event_handler.handle_cancel_reaction(reaction, user)
+        await handler(reaction, user)
@@ -1,51 +1,92 @@
 import asyncio
 import logging
-from typing import Any, Dict, Optional
+from itertools import islice
+from typing import Any, Coroutine, Dict, List, Optional, Set
 
-from bot.core.typing import TypingManager
 from bot.message.reactions import ReactionManager
 from bot.types import Request, RequestState
 from settings import Settings
 
 log = logging.getLogger("Bard")
 
+_ACTIVE_STATES = frozenset((RequestState.PENDING, RequestState.PROCESSING))
+
 
 class RequestManager:
-    def __init__(self, reaction_manager: ReactionManager, typing_manager: TypingManager):
+    def __init__(self, reaction_manager: ReactionManager):
         self._requests: Dict[str, Request] = {}
+        self._requests_by_message_id: Dict[int, List[str]] = {}
+        self._requests_by_bot_message_id: Dict[int, str] = {}
+        self._live_tasks: Set[asyncio.Task] = set()
         self._max_requests = Settings.MAX_REQUESTS
         self._reaction_manager = reaction_manager
-        self._typing_manager = typing_manager
         log.info("RequestManager initialized.")
 
     def _cleanup_old_requests(self):
-        """Removes the oldest requests to keep the cache within limits."""
-        if len(self._requests) > self._max_requests:
-            keys_to_remove = list(self._requests.keys())[: len(self._requests) - self._max_requests]
-            for key in keys_to_remove:
-                del self._requests[key]
+        """Removes the oldest finished requests to keep the cache within limits."""
+        excess = len(self._requests) - self._max_requests
+        if excess <= 0:
+            return
+        stale_ids = list(
+            islice(
+                (request_id for request_id, request in self._requests.items() if request.state not in _ACTIVE_STATES),
+                excess,
+            )
+        )
+        for request_id in stale_ids:
+            self.forget_request(request_id)
+
+    def forget_request(self, request_id: str):
+        """Stops tracking a request and drops it from the message indexes."""
+        request = self._requests.pop(request_id, None)
+        if not request:
+            return
+        request_ids = self._requests_by_message_id.get(request.original_message_id)
+        if request_ids:
+            request_ids.remove(request_id)
+            if not request_ids:
+                del self._requests_by_message_id[request.original_message_id]
+        for bot_message in request.bot_messages:
+            if self._requests_by_bot_message_id.get(bot_message.id) == request_id:
+                del self._requests_by_bot_message_id[bot_message.id]
 
     def create_request(self, message: Any, original_message_id: int) -> Request:
         request = Request(message=message, original_message_id=original_message_id)
         self._requests[request.id] = request
+        self._requests_by_message_id.setdefault(original_message_id, []).append(request.id)
         self._cleanup_old_requests()
-        log.debug(f"Request {request.id} created for message {original_message_id}.")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Request %s created for message %s.", request.id, original_message_id)
         return request
 
     def get_request(self, request_id: str) -> Optional[Request]:
         return self._requests.get(request_id)
 
+    def get_requests_by_message_id(self, message_id: int) -> List[Request]:
+        """Returns the tracked requests for a user message, oldest first."""
+        return [self._requests[request_id] for request_id in self._requests_by_message_id.get(message_id, ())]
+
+    def register_bot_messages(self, request_id: str, messages: List[Any]):
+        """Records which request produced the given bot messages, unless the request is no longer tracked."""
+        if request_id not in self._requests:
+            return
+        for message in messages:
+            self._requests_by_bot_message_id[message.id] = request_id
+
+    def get_request_by_bot_message_id(self, message_id: int) -> Optional[Request]:
+        """Returns the most recent request that sent or edited the given bot message."""
+        request_id = self._requests_by_bot_message_id.get(message_id)
+        return self._requests.get(request_id) if request_id else None
+
     async def cancel_request(self, request_id: str, is_edit: bool = False) -> bool:
         request = self.get_request(request_id)
         if not request:
-            log.warning(f"Attempted to cancel non-existent request {request_id}.")
+            log.warning("Attempted to cancel non-existent request %s.", request_id)
             return False
         if request.state in [RequestState.DONE, RequestState.CANCELLED]:
-            log.warning(f"Attempted to cancel already completed or cancelled request {request_id}.")
+            log.warning("Attempted to cancel already completed or cancelled request %s.", request_id)
             return False
         request.state = RequestState.CANCELLED
-        if request.message:
-            self._typing_manager.stop_typing(request.message.channel)
         if request.task and not request.task.done():
             request.task.cancel()
             log.info("Cancelled request task.")
@@ -55,15 +96,21 @@ class RequestManager:
     def update_request_state(self, request_id: str, state: RequestState):
         request = self.get_request(request_id)
         if request:
-            log.debug(f"Updating request {request_id} state from {request.state} to {state}.")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Updating request %s state from %s to %s.", request_id, request.state, state)
             request.state = state
         else:
-            log.warning(f"Attempted to update state for non-existent request {request_id}.")
+            log.warning("Attempted to update state for non-existent request %s.", request_id)
 
-    def assign_task_to_request(self, request_id: str, task: asyncio.Task):
-        request = self.get_request(request_id)
-        if request:
-            request.task = task
-            log.debug(f"Assigned task to request {request_id}.")
-        else:
-            log.warning(f"Attempted to assign task to non-existent request {request_id}.")
+    def start_request_task(self, request: Request, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """
+        Schedules the processing coroutine for a request and keeps a strong reference to its task
+        until it finishes, so the event loop cannot garbage-collect it mid-flight.
+        """
+        task = asyncio.create_task(coro)
+        request.task = task
+        self._live_tasks.add(task)
+        task.add_done_callback(self._live_tasks.discard)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Assigned task to request %s.", request.id)
+        return task
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 import discord
 
@@ -14,57 +15,64 @@ class PresenceManager:
 
     def __init__(self, bot: discord.Client, settings: Settings):
         """
-        Initializes the PresenceManager.
+        Initializes the PresenceManager and builds the configured activity once.
         Args:
             bot: The Discord bot instance.
             settings: The application configuration settings.
         """
         self.bot = bot
         self.settings = settings
+        self._activity_type = settings.PRESENCE_TYPE.lower()
+        self._activity = self._build_activity()
         log.debug("PresenceManager initialized.")
 
+    def _build_activity(self) -> Optional[discord.BaseActivity]:
+        """
+        Builds the activity described by the presence settings.
+        Returns:
+            The activity to display, or None if the configured presence type is invalid.
+        """
+        log.debug(f"Presence type from settings: {self._activity_type}")
+        if self._activity_type == "playing":
+            return discord.Game(name=self.settings.PRESENCE_TEXT)
+        if self._activity_type == "listening":
+            return discord.Activity(
+                type=discord.ActivityType.listening,
+                name=self.settings.PRESENCE_TEXT,
+            )
+        if self._activity_type == "watching":
+            return discord.Activity(
+                type=discord.ActivityType.watching,
+                name=self.settings.PRESENCE_TEXT,
+            )
+        if self._activity_type == "custom":
+            presence_emoji = None
+            if self.settings.PRESENCE_EMOJI:
+                try:
+                    presence_emoji = discord.PartialEmoji.from_str(self.settings.PRESENCE_EMOJI)
+                except Exception as e:
+                    log.warning(
+                        "Could not parse PRESENCE_EMOJI into PartialEmoji.",
+                        extra={
+                            "presence_emoji": self.settings.PRESENCE_EMOJI,
+                            "error": e,
+                        },
+                    )
+            return discord.CustomActivity(name=self.settings.PRESENCE_TEXT, emoji=presence_emoji)
+        return None
+
     async def set_presence(self):
         """
         Sets the bot's presence based on the configuration.
         """
         try:
             log.debug("Setting bot presence.")
-            activity = None
-            activity_type = self.settings.PRESENCE_TYPE.lower()
-            log.debug(f"Presence type from settings: {activity_type}")
-            if activity_type == "playing":
-                activity = discord.Game(name=self.settings.PRESENCE_TEXT)
-            elif activity_type == "listening":
-                activity = discord.Activity(
-                    type=discord.ActivityType.listening,
-                    name=self.settings.PRESENCE_TEXT,
-                )
-            elif activity_type == "watching":
-                activity = discord.Activity(
-                    type=discord.ActivityType.watching,
-                    name=self.settings.PRESENCE_TEXT,
-                )
-            elif activity_type == "custom":
-                presence_emoji = None
-                if self.settings.PRESENCE_EMOJI:
-                    try:
-                        presence_emoji = discord.PartialEmoji.from_str(self.settings.PRESENCE_EMOJI)
-                    except Exception as e:
-                        log.warning(
-                            "Could not parse PRESENCE_EMOJI into PartialEmoji.",
-                            extra={
-                                "presence_emoji": self.settings.PRESENCE_EMOJI,
-                                "error": e,
-                            },
-                        )
-                        presence_emoji = None
-                activity = discord.CustomActivity(name=self.settings.PRESENCE_TEXT, emoji=presence_emoji)
-            if activity:
-                await self.bot.change_presence(activity=activity)
+            if self._activity:
+                await self.bot.change_presence(activity=self._activity)
                 log.info(
                     "Bot presence updated successfully.",
                     extra={
-                        "type": activity_type,
+                        "type": self._activity_type,
                         "text": self.settings.PRESENCE_TEXT,
                     },
                 )
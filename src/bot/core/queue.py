@@ -1,9 +1,12 @@
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
 
+from bot.core.lifecycle import RequestManager
 from bot.message.sender import MessageSender
 from bot.types import Request
+from settings import Settings
 
 log = logging.getLogger("Bard")
 
@@ -11,37 +14,28 @@ log = logging.getLogger("Bard")
 class MessageQueue:
     """
     Manages a message queue system for outbound Discord messages, ensuring
-    messages are sent sequentially and handling rate limits more gracefully.
+    messages are sent sequentially per channel and handling rate limits more gracefully.
+    Each channel has its own FIFO of pending messages. A fixed pool of workers takes
+    channel IDs from a shared ready queue that holds each channel at most once, so a
+    channel is only ever served by one worker at a time and never blocks the others.
     """
 
-    def __init__(self, message_sender: MessageSender):
+    def __init__(self, message_sender: MessageSender, request_manager: RequestManager):
         """
         Initializes the MessageQueue.
         Args:
             message_sender: The service used to send messages to Discord.
+            request_manager: The service tracking requests and the bot messages they produce.
         """
         self.message_sender = message_sender
-        self.queues: Dict[int, asyncio.Queue] = {}
+        self.request_manager = request_manager
+        self._channel_queues: Dict[int, Deque[Tuple[Dict[str, Any], Optional[Request]]]] = {}
+        self._ready_channels: asyncio.Queue[int] = asyncio.Queue()
+        self._scheduled_channels: Set[int] = set()
         self.worker_tasks: List[asyncio.Task] = []
         self._running = False
         log.debug("MessageQueue initialized.")
 
-    def get_queue(self, channel_id: int) -> asyncio.Queue:
-        """
-        Retrieves or creates a queue for the specified channel ID.
-        Args:
-            channel_id: The ID of the Discord channel.
-        Returns:
-            The asyncio.Queue for the channel.
-        """
-        if channel_id not in self.queues:
-            self.queues[channel_id] = asyncio.Queue()
-            log.debug(f"Created new message queue for channel {channel_id}.")
-            if self._running:
-                task = asyncio.create_task(self._process_queue(channel_id, self.queues[channel_id]))
-                self.worker_tasks.append(task)
-        return self.queues[channel_id]
-
     async def enqueue(
         self,
         channel_id: int,
@@ -55,22 +49,27 @@ class MessageQueue:
             message_data: A dictionary containing the arguments for MessageSender.send.
             request: Optional Request object to update with sent messages.
         """
-        queue = self.get_queue(channel_id)
-        await queue.put((message_data, request))
-        log.debug(f"Enqueued message for channel {channel_id}. Queue size: {queue.qsize()}")
+        channel_queue = self._channel_queues.get(channel_id)
+        if channel_queue is None:
+            channel_queue = self._channel_queues[channel_id] = deque()
+        channel_queue.append((message_data, request))
+        if channel_id not in self._scheduled_channels:
+            self._scheduled_channels.add(channel_id)
+            self._ready_channels.put_nowait(channel_id)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Enqueued message for channel {channel_id}. Channel queue size: {len(channel_queue)}")
 
     def start_workers(self):
         """
-        Starts worker tasks for all existing queues and sets the running flag.
+        Starts the worker pool and sets the running flag.
         """
         if self._running:
             log.warning("MessageQueue workers are already running.")
             return
         self._running = True
-        log.info("Starting MessageQueue workers.")
-        for channel_id, queue in self.queues.items():
-            task = asyncio.create_task(self._process_queue(channel_id, queue))
-            self.worker_tasks.append(task)
+        log.info("Starting MessageQueue workers.", extra={"count": Settings.MESSAGE_QUEUE_WORKERS})
+        for _ in range(Settings.MESSAGE_QUEUE_WORKERS):
+            self.worker_tasks.append(asyncio.create_task(self._worker()))
 
     async def stop_workers(self):
         """
@@ -84,53 +83,71 @@ class MessageQueue:
             await asyncio.gather(*self.worker_tasks, return_exceptions=True)
         self.worker_tasks.clear()
 
-    async def _process_queue(self, channel_id: int, queue: asyncio.Queue):
+    async def _worker(self):
         """
-        Worker task that processes messages from a specific channel's queue.
-        It will exit if the queue remains empty for 5 minutes.
-        Args:
-            channel_id: The ID of the channel.
-            queue: The queue to process.
+        Worker task that takes a ready channel, sends its oldest pending message and
+        hands the channel back to the ready queue if more messages are waiting.
+        Only the worker holding a channel sends to it, so messages for the same channel
+        are sent in the order they were enqueued.
         """
-        log.debug(f"Started worker for channel {channel_id}.")
         while self._running:
             try:
-                item = await asyncio.wait_for(queue.get(), timeout=300.0)
-                message_data, request = item
-                log.debug(f"Processing message for channel {channel_id}.")
-                try:
-                    sent_messages = await self.message_sender.send(**message_data)
-                    if request and sent_messages:
-                        current_messages = request.bot_messages
-                        current_ids = {m.id for m in current_messages}
-                        new_messages = [m for m in sent_messages if m.id not in current_ids]
-                        if new_messages:
-                            request.bot_messages = current_messages + new_messages
-                            request.messages_ready.set()
-                except Exception as e:
-                    log.error(
-                        f"Error sending message in channel {channel_id}: {e}",
-                        exc_info=True,
-                    )
-                finally:
-                    queue.task_done()
-            except asyncio.TimeoutError:
-                if queue.empty():
-                    if channel_id in self.queues:
-                        del self.queues[channel_id]
-                    log.debug(f"Worker for channel {channel_id} timed out due to inactivity. Cleaning up.")
-                    break
-                continue
+                channel_id = await self._ready_channels.get()
             except asyncio.CancelledError:
-                log.debug(f"Worker for channel {channel_id} cancelled.")
+                log.debug("MessageQueue worker cancelled.")
+                break
+            channel_queue = self._channel_queues[channel_id]
+            message_data, request = channel_queue.popleft()
+            try:
+                await self._send(channel_id, message_data, request)
+            except asyncio.CancelledError:
+                log.debug("MessageQueue worker cancelled.")
                 break
             except Exception as e:
                 log.error(
                     f"Unexpected error in worker for channel {channel_id}: {e}",
                     exc_info=True,
                 )
-                await asyncio.sleep(1)
+            finally:
+                self._release_channel(channel_id, channel_queue)
+                self._ready_channels.task_done()
+
+    def _release_channel(self, channel_id: int, channel_queue: Deque[Tuple[Dict[str, Any], Optional[Request]]]):
+        """
+        Hands a channel back after one of its messages was sent: it goes to the back of the
+        ready queue if it has more pending messages, otherwise its queue is discarded.
+        Args:
+            channel_id: The ID of the channel.
+            channel_queue: The channel's pending messages.
+        """
+        if channel_queue:
+            self._ready_channels.put_nowait(channel_id)
+        else:
+            del self._channel_queues[channel_id]
+            self._scheduled_channels.discard(channel_id)
 
-        current_task = asyncio.current_task()
-        if current_task in self.worker_tasks:
-            self.worker_tasks.remove(current_task)
+    async def _send(self, channel_id: int, message_data: Dict[str, Any], request: Optional[Request]):
+        """
+        Sends a single queued message and records the resulting bot messages on its request.
+        Args:
+            channel_id: The ID of the channel.
+            message_data: A dictionary containing the arguments for MessageSender.send.
+            request: Optional Request object to update with sent messages.
+        """
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Processing message for channel {channel_id}.")
+        try:
+            sent_messages = await self.message_sender.send(**message_data)
+            if request and sent_messages:
+                known_ids = request.bot_message_ids
+                new_messages = [m for m in sent_messages if m.id not in known_ids]
+                if new_messages:
+                    known_ids.update(m.id for m in new_messages)
+                    request.bot_messages.extend(new_messages)
+                    self.request_manager.register_bot_messages(request.id, new_messages)
+                    request.messages_ready.set()
+        except Exception as e:
+            log.error(
+                f"Error sending message in channel {channel_id}: {e}",
+                exc_info=True,
+            )
@@ -1,8 +1,8 @@
 import asyncio
 import logging
 import os
-from contextlib import AbstractAsyncContextManager
-from typing import Dict, Protocol
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import AsyncIterator, Dict, Protocol
 
 from settings import Settings
 
@@ -15,54 +15,110 @@ class TypeableChannel(Protocol):
 
 log = logging.getLogger("Bard")
 
+_TYPING_IDLE_TIMEOUT = 60.0
+
+
+class _TypingState:
+    """
+    The reusable typing task of a channel and the events used to switch it on and off.
+    """
+
+    __slots__ = ("task", "active", "idle", "refs")
+
+    def __init__(self):
+        self.task: asyncio.Task
+        self.active = asyncio.Event()
+        self.idle = asyncio.Event()
+        self.refs = 0
+
 
 class TypingManager:
     """
     Manages the typing indicator for different channels.
+    Each channel gets one long-lived typing task that is switched on and off by reference
+    counting; the task only exits after staying idle for a while.
     """
 
     def __init__(self, settings: Settings):
-        self._typing_tasks: Dict[int, asyncio.Task] = {}
+        self._typing_states: Dict[int, _TypingState] = {}
         self.settings = settings
+        self._signal_files = settings.TYPING_SIGNAL_FILES
+        if self._signal_files:
+            os.makedirs(settings.CACHE_DIR, exist_ok=True)
 
     def _get_signal_path(self, channel_id: int) -> str:
         return os.path.join(self.settings.CACHE_DIR, f"bot_typing_{channel_id}")
 
-    async def _typing_loop(self, channel: TypeableChannel):
-        signal_path = self._get_signal_path(channel.id)
+    async def _typing_loop(self, channel: TypeableChannel, state: _TypingState):
+        signal_path = self._get_signal_path(channel.id) if self._signal_files else None
         try:
-            os.makedirs(os.path.dirname(signal_path), exist_ok=True)
-            with open(signal_path, "w") as f:
-                f.write("typing")
-            async with channel.typing():
-                await asyncio.Future()
+            while True:
+                try:
+                    await asyncio.wait_for(state.active.wait(), timeout=_TYPING_IDLE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    if state.refs:
+                        continue
+                    if self._typing_states.get(channel.id) is state:
+                        del self._typing_states[channel.id]
+                    return
+                try:
+                    if signal_path:
+                        with open(signal_path, "w") as f:
+                            f.write("typing")
+                    async with channel.typing():
+                        await state.idle.wait()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    log.warning("Error in typing loop for channel %s: %s", channel.id, e, exc_info=True)
+                    await state.idle.wait()
+                finally:
+                    if signal_path:
+                        try:
+                            os.unlink(signal_path)
+                        except FileNotFoundError:
+                            pass
+                        except Exception as e:
+                            log.warning("Failed to remove typing signal for %s: %s", channel.id, e)
         except asyncio.CancelledError:
             pass
-        except Exception as e:
-            log.warning(f"Error in typing loop for channel {channel.id}: {e}", exc_info=True)
-        finally:
-            try:
-                if os.path.exists(signal_path):
-                    os.remove(signal_path)
-            except Exception as e:
-                log.warning(f"Failed to remove typing signal for {channel.id}: {e}")
 
     def start_typing(self, channel: TypeableChannel):
         """
         Starts the typing indicator in the specified channel.
         """
-        if channel.id in self._typing_tasks:
-            return
-        task = asyncio.create_task(self._typing_loop(channel))
-        self._typing_tasks[channel.id] = task
-        log.debug(f"Started typing in channel {channel.id}.")
+        state = self._typing_states.get(channel.id)
+        if state is None:
+            state = self._typing_states[channel.id] = _TypingState()
+            state.task = asyncio.create_task(self._typing_loop(channel, state))
+        state.refs += 1
+        if state.refs == 1:
+            state.idle.clear()
+            state.active.set()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Started typing in channel %s.", channel.id)
 
     def stop_typing(self, channel: TypeableChannel):
         """
-        Stops the typing indicator in the specified channel.
+        Stops the typing indicator in the specified channel once every caller that started it has stopped.
         """
-        if channel.id not in self._typing_tasks:
+        state = self._typing_states.get(channel.id)
+        if state is None or not state.refs:
             return
-        task = self._typing_tasks.pop(channel.id)
-        task.cancel()
-        log.debug(f"Stopped typing in channel {channel.id}.")
+        state.refs -= 1
+        if not state.refs:
+            state.active.clear()
+            state.idle.set()
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Stopped typing in channel %s.", channel.id)
+
+    @asynccontextmanager
+    async def typing_for(self, channel: TypeableChannel) -> AsyncIterator[None]:
+        """
+        Shows the typing indicator in the specified channel for the duration of the block.
+        """
+        self.start_typing(channel)
+        try:
+            yield
+        finally:
+            self.stop_typing(channel)
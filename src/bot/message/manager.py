@@ -24,7 +24,6 @@ class MessageManager:
             message: The discord.Message object to delete.
         """
         try:
-            log.debug("Attempting to delete message.", extra={"message_id": message.id})
             await message.delete()
             log.info("Message deleted successfully.", extra={"message_id": message.id})
         except discord.NotFound:
@@ -39,11 +38,6 @@ class MessageManager:
                 "HTTP error while deleting message.",
                 extra={"message_id": message.id, "error": e},
             )
-        except Exception as e:
-            log.error(
-                "An unexpected error occurred while deleting message.",
-                extra={"message_id": message.id, "error": e},
-            )
 
     async def remove_reaction(self, message: discord.Message, emoji: str, user: Optional[discord.User] = None):
         """
@@ -53,16 +47,8 @@ class MessageManager:
             emoji: The emoji (str) to remove.
             user: Optional; The discord.User whose reaction to remove. If None, removes bot's own reaction.
         """
+        target_user = user or message.author
         try:
-            target_user = user or message.author
-            log.debug(
-                "Attempting to remove reaction.",
-                extra={
-                    "message_id": message.id,
-                    "emoji": emoji,
-                    "user_id": target_user.id,
-                },
-            )
             await message.remove_reaction(emoji, target_user)
             log.info(
                 "Reaction removed successfully.",
@@ -87,8 +73,3 @@ class MessageManager:
                 "HTTP error while removing reaction.",
                 extra={"message_id": message.id, "emoji": emoji, "error": e},
             )
-        except Exception as e:
-            log.error(
-                "An unexpected error occurred while removing reaction.",
-                extra={"message_id": message.id, "emoji": emoji, "error": e},
-            )
@@ -1,9 +1,14 @@
+import asyncio
 import logging
 import mimetypes
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
 
+import aiofiles
 import discord
 from discord import Message
 from google.genai import types
@@ -11,10 +16,20 @@ from google.genai import types
 from ai.chat.files import AttachmentProcessor
 from ai.context.replies import ReplyChainConstructor
 from bot.types import DiscordContext, ParsedMessageContext, VideoMetadata
+from scraper.models import ScrapedData
 from scraper.orchestrator import ScrapingOrchestrator
 
 log = logging.getLogger("Bard")
 
+_MARKDOWN_LINK_RE = re.compile(r"\[[^\]]*\]\([^)]+\)")
+_MASKED_URL_RE = re.compile(r"<(?:https?://|www\.)[^>]+>")
+_URL_RE = re.compile(r"(?:https?://|www\.)[a-zA-Z0-9\-\._~:/?#\[\]@!$&'()*+,;=%]+", re.ASCII)
+_MAX_CONCURRENT_ATTACHMENT_READS = 8
+_VIDEO_METADATA_CACHE_SIZE = 1024
+_YOUTUBE_HOSTS = ("youtube.com", "youtu.be")
+_YOUTUBE_SUBDOMAIN_SUFFIXES = (".youtube.com", ".youtu.be")
+_CHANNEL_MEMBERS_TTL = 60.0
+
 
 class MessageParser:
     """
@@ -40,8 +55,42 @@ class MessageParser:
         self.scraping_orchestrator = scraping_orchestrator
         self.bot_user_id = bot_user_id
         self.reply_chain_constructor = ReplyChainConstructor()
+        self._attachment_read_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_ATTACHMENT_READS)
+        self._video_metadata_cache: OrderedDict[Tuple[str, Optional[str]], VideoMetadata] = OrderedDict()
+        self._channel_members_cache: Dict[int, Tuple[float, Optional[int], Tuple[int, ...]]] = {}
+        self._utc_time_cache: Tuple[int, str] = (0, "")
         log.debug("MessageParser initialized.")
 
+    async def _read_attachment(self, attachment: discord.Attachment) -> bytes:
+        """
+        Downloads an attachment, limiting how many downloads run at once.
+        Args:
+            attachment: The Discord attachment to download.
+        Returns:
+            The raw bytes of the attachment.
+        """
+        async with self._attachment_read_semaphore:
+            return await attachment.read()
+
+    def _get_channel_member_ids(self, channel: discord.TextChannel) -> Tuple[int, ...]:
+        """
+        Returns the IDs of the non-bot members who can see a text channel.
+        Resolving channel.members checks permissions for every guild member, so the result is
+        cached per channel until it expires or the guild's member count changes.
+        Args:
+            channel: The Discord text channel.
+        Returns:
+            A tuple of member IDs.
+        """
+        now = time.monotonic()
+        member_count = channel.guild.member_count
+        cached = self._channel_members_cache.get(channel.id)
+        if cached is not None and cached[0] > now and cached[1] == member_count:
+            return cached[2]
+        member_ids = tuple(member.id for member in channel.members if not member.bot)
+        self._channel_members_cache[channel.id] = (now + _CHANNEL_MEMBERS_TTL, member_count, member_ids)
+        return member_ids
+
     async def _extract_discord_context(self, message: Message) -> DiscordContext:
         """
         Extracts relevant Discord environment information from the message.
@@ -56,9 +105,7 @@ class MessageParser:
         channel_topic = getattr(channel, "topic", None)
         users_in_channel = []
         if isinstance(channel, discord.TextChannel):
-            for member in channel.members:
-                if not member.bot:
-                    users_in_channel.append(member.id)
+            users_in_channel.extend(self._get_channel_member_ids(channel))
         elif isinstance(channel, discord.DMChannel) and message.author:
             users_in_channel.append(message.author.id)
             if self.bot_user_id:
@@ -67,7 +114,10 @@ class MessageParser:
         if message.reference and message.reference.resolved:
             if isinstance(message.reference.resolved, discord.Message):
                 replied_user_id = message.reference.resolved.author.id
-        current_time_utc = datetime.now(timezone.utc).isoformat()
+        now = int(time.time())
+        if now != self._utc_time_cache[0]:
+            self._utc_time_cache = (now, datetime.fromtimestamp(now, timezone.utc).isoformat())
+        current_time_utc = self._utc_time_cache[1]
         sender_user_id = message.author.id
         discord_context = DiscordContext(
             channel_id=channel_id,
@@ -86,13 +136,20 @@ class MessageParser:
     def _create_video_metadata(self, url: str, info_dict: dict[str, Any]) -> VideoMetadata:
         """
         Creates a VideoMetadata object from a yt-dlp info dictionary.
+        Recently created objects are cached per URL and upload date and reused.
         Args:
             url: The original URL of the video.
             info_dict: The dictionary returned by yt-dlp's `extract_info`.
         Returns:
             A VideoMetadata object populated with extracted information.
         """
-        return VideoMetadata(
+        cache_key = (url, info_dict.get("upload_date"))
+        video_metadata = self._video_metadata_cache.get(cache_key)
+        if video_metadata is not None:
+            self._video_metadata_cache.move_to_end(cache_key)
+            return video_metadata
+        host = (urlsplit(url).hostname or "").lower()
+        video_metadata = VideoMetadata(
             url=url,
             title=info_dict.get("title"),
             description=info_dict.get("description"),
@@ -103,8 +160,99 @@ class MessageParser:
             average_rating=info_dict.get("average_rating"),
             categories=info_dict.get("categories"),
             tags=info_dict.get("tags"),
-            is_youtube="youtube.com" in url or "youtu.be" in url,
+            is_youtube=host in _YOUTUBE_HOSTS or host.endswith(_YOUTUBE_SUBDOMAIN_SUFFIXES),
+        )
+        self._video_metadata_cache[cache_key] = video_metadata
+        if len(self._video_metadata_cache) > _VIDEO_METADATA_CACHE_SIZE:
+            self._video_metadata_cache.popitem(last=False)
+        return video_metadata
+
+    @staticmethod
+    def _extract_urls(text: str) -> Set[str]:
+        """
+        Extracts the URLs to scrape from message text, ignoring markdown links and masked URLs.
+        Text without any URL prefix is rejected with a substring check before any regex runs.
+        Args:
+            text: The message content combined with its reply chain.
+        Returns:
+            A set of unique URLs.
+        """
+        if "http" not in text and "www." not in text:
+            return set()
+        text = _MARKDOWN_LINK_RE.sub("", text)
+        text = _MASKED_URL_RE.sub("", text)
+        return set(_URL_RE.findall(text))
+
+    async def _scrape_urls(self, urls: Set[str]) -> List[ScrapedData]:
+        """
+        Scrapes the URLs found in a message.
+        Args:
+            urls: The URLs to scrape.
+        Returns:
+            A list of ScrapedData objects, empty if there were no URLs.
+        """
+        if not urls:
+            return []
+        log.info(
+            "Found URLs to scrape.",
+            extra={"count": len(urls), "urls": list(urls)},
+        )
+        scraped_data_list = await self.scraping_orchestrator.process_urls(list(urls))
+        log.debug(
+            "Scraping complete.",
+            extra={"results_count": len(scraped_data_list)},
         )
+        return scraped_data_list
+
+    async def _process_scraped_video(
+        self, scraped_data: ScrapedData
+    ) -> Tuple[Optional[types.File], Optional[VideoMetadata]]:
+        """
+        Uploads a scraped video file and builds its metadata.
+        Args:
+            scraped_data: The scraped data of a URL that points to a video.
+        Returns:
+            A tuple of the uploaded video file and the video metadata, either of which may be None.
+        """
+        video_details = scraped_data.video_details
+        assert video_details is not None
+        log.debug(
+            "Processing scraped video data.",
+            extra={"url": scraped_data.url.resolved},
+        )
+        video_file = None
+        if video_details.video_path:
+            mime_type, _ = mimetypes.guess_type(video_details.video_path)
+            if mime_type:
+                try:
+                    async with aiofiles.open(video_details.video_path, "rb") as f:
+                        video_bytes = await f.read()
+                    video_file = await self.attachment_processor.upload_media_bytes(
+                        video_bytes,
+                        display_name=video_details.video_path,
+                        mime_type=mime_type,
+                    )
+                    if video_file:
+                        log.debug(
+                            "Uploaded video file from scraped data.",
+                            extra={"uri": video_file.uri},
+                        )
+                except Exception:
+                    log.error(
+                        f"Failed to read and upload video file: {video_details.video_path}",
+                        exc_info=True,
+                    )
+        video_metadata = None
+        if video_details.metadata:
+            video_metadata = self._create_video_metadata(
+                scraped_data.url.resolved,
+                video_details.metadata,
+            )
+            log.debug(
+                "Created video metadata from scraped data.",
+                extra={"url": scraped_data.url.resolved},
+            )
+        return video_file, video_metadata
 
     async def parse(self, message: Message) -> ParsedMessageContext:
         """
@@ -127,79 +275,38 @@ class MessageParser:
                 "attachment_count": len(replied_attachments),
             },
         )
-        url_pattern = r"(?:https?://|www\.)[a-zA-Z0-9\-\._~:/?#\[\]@!$&'()*+,;=%]+"
-        combined_content_for_url_extraction = f"{message.content} {reply_chain_text}"
-        content_without_markdown_links = re.sub(r"\[[^\]]*\]\([^)]+\)", "", combined_content_for_url_extraction)
-        content_without_masked_urls = re.sub(r"<(?:https?://|www\.)[^>]+>", "", content_without_markdown_links)
-        urls_in_message = set(re.findall(url_pattern, content_without_masked_urls))
-        scraped_data_list = []
-        if urls_in_message:
-            log.info(
-                "Found URLs to scrape.",
-                extra={"count": len(urls_in_message), "urls": list(urls_in_message)},
-            )
-            scraped_data_list = await self.scraping_orchestrator.process_urls(list(urls_in_message))
-            log.debug(
-                "Scraping complete.",
-                extra={"results_count": len(scraped_data_list)},
-            )
-        processed_video_parts: List[types.File] = []
-        video_metadata_list: List[VideoMetadata] = []
-        for scraped_data in scraped_data_list:
-            if not scraped_data:
-                continue
-            if scraped_data.video_details and scraped_data.video_details.is_video:
-                log.debug(
-                    "Processing scraped video data.",
-                    extra={"url": scraped_data.url.resolved},
-                )
-                if scraped_data.video_details.video_path:
-                    mime_type, _ = mimetypes.guess_type(scraped_data.video_details.video_path)
-                    if mime_type:
-                        try:
-                            with open(scraped_data.video_details.video_path, "rb") as f:
-                                video_bytes = f.read()
-                            video_file = await self.attachment_processor.upload_media_bytes(
-                                video_bytes,
-                                display_name=scraped_data.video_details.video_path,
-                                mime_type=mime_type,
-                            )
-                            if video_file:
-                                processed_video_parts.append(video_file)
-                                log.debug(
-                                    "Uploaded video file from scraped data.",
-                                    extra={"uri": video_file.uri},
-                                )
-                        except Exception:
-                            log.error(
-                                f"Failed to read and upload video file: {scraped_data.video_details.video_path}",
-                                exc_info=True,
-                            )
-                if scraped_data.video_details.metadata:
-                    video_metadata = self._create_video_metadata(
-                        scraped_data.url.resolved,
-                        scraped_data.video_details.metadata,
-                    )
-                    video_metadata_list.append(video_metadata)
-                    log.debug(
-                        "Created video metadata from scraped data.",
-                        extra={"url": scraped_data.url.resolved},
-                    )
-        attachments_data = []
-        attachments_mime_types = []
+        urls_in_message = self._extract_urls(f"{message.content} {reply_chain_text}")
         all_attachments = message.attachments + replied_attachments
+        attachments_mime_types = [
+            attachment.content_type or "application/octet-stream" for attachment in all_attachments
+        ]
         log.debug(
             "Processing attachments.",
             extra={"attachment_count": len(all_attachments)},
         )
-        for attachment in all_attachments:
-            mime_type = attachment.content_type if attachment.content_type else "application/octet-stream"
-            attachments_data.append(await attachment.read())
-            attachments_mime_types.append(mime_type)
+        scraped_data_list, attachments_data = await asyncio.gather(
+            self._scrape_urls(urls_in_message),
+            asyncio.gather(*(self._read_attachment(attachment) for attachment in all_attachments)),
+        )
+        attachments_data = list(attachments_data)
         log.debug(
             "Finished processing attachments.",
             extra={"processed_count": len(attachments_data)},
         )
+        processed_video_parts: List[types.File] = []
+        video_metadata_list: List[VideoMetadata] = []
+        video_results = await asyncio.gather(
+            *(
+                self._process_scraped_video(scraped_data)
+                for scraped_data in scraped_data_list
+                if scraped_data and scraped_data.video_details and scraped_data.video_details.is_video
+            )
+        )
+        for video_file, video_metadata in video_results:
+            if video_file:
+                processed_video_parts.append(video_file)
+            if video_metadata:
+                video_metadata_list.append(video_metadata)
         discord_context = await self._extract_discord_context(message)
         parsed_context = ParsedMessageContext(
             message=message,
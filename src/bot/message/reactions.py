@@ -15,15 +15,17 @@ class ReactionManager:
     Encapsulates the logic for handling reaction-related operations.
     """
 
-    def __init__(self, retry_emoji: str, cancel_emoji: str):
+    def __init__(self, retry_emoji: str, cancel_emoji: str, bot_user_id: Optional[int] = None):
         """
         Initializes the ReactionManager.
         Args:
             retry_emoji: The emoji used for retrying interactions.
             cancel_emoji: The emoji used to cancel a response generation.
+            bot_user_id: The Discord user ID of the bot.
         """
         self.retry_emoji = retry_emoji
         self.cancel_emoji = cancel_emoji
+        self.bot_user_id = bot_user_id
         log.debug("ReactionManager initialized.")
 
     async def handle_request_creation(self, request: Request):
@@ -34,7 +36,8 @@ class ReactionManager:
         try:
             await message.add_reaction(self.cancel_emoji)
             request.cancel_emoji_added = True
-            log.debug("Added cancel reaction to message.", extra={"message_id": message.id})
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Added cancel reaction to message.", extra={"message_id": message.id})
         except discord.HTTPException as e:
             log.warning(
                 "Failed to add cancel reaction.",
@@ -45,15 +48,9 @@ class ReactionManager:
         """Handles reactions for a completed request."""
         user_message: Optional[Message] = request.message
         bot_messages: Optional[list[Message]] = request.bot_messages
-        if user_message and request.cancel_emoji_added:
+        if user_message and request.cancel_emoji_added and self.bot_user_id is not None:
             try:
-                bot_user = None
-                if user_message.guild:
-                    bot_user = user_message.guild.me
-                elif isinstance(user_message.channel, (discord.DMChannel, discord.GroupChannel)):
-                    bot_user = user_message.channel.me
-                if bot_user:
-                    await user_message.remove_reaction(self.cancel_emoji, bot_user)
+                await user_message.remove_reaction(self.cancel_emoji, discord.Object(id=self.bot_user_id))
             except discord.HTTPException as e:
                 log.warning(
                     "Failed to remove cancel reaction from user message.",
@@ -111,10 +108,11 @@ class ReactionManager:
             tool_emojis: Optional list of tool emojis to add as reactions.
         """
         try:
-            log.debug(
-                "Adding retry reaction.",
-                extra={"message_id": message.id, "emoji": self.retry_emoji},
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Adding retry reaction.",
+                    extra={"message_id": message.id, "emoji": self.retry_emoji},
+                )
             await message.add_reaction(self.retry_emoji)
         except discord.HTTPException as e:
             log.warning(
@@ -122,10 +120,11 @@ class ReactionManager:
                 extra={"message_id": message.id, "error": e},
             )
         if tool_emojis:
-            log.debug(
-                "Adding tool emojis.",
-                extra={"message_id": message.id, "emojis": tool_emojis},
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Adding tool emojis.",
+                    extra={"message_id": message.id, "emojis": tool_emojis},
+                )
             for emoji in tool_emojis:
                 try:
                     await message.add_reaction(emoji)
@@ -144,14 +143,15 @@ class ReactionManager:
         """
         reaction, user = reaction_to_remove
         try:
-            log.debug(
-                "Removing reaction.",
-                extra={
-                    "message_id": reaction.message.id,
-                    "user_id": user.id,
-                    "emoji": str(reaction.emoji),
-                },
-            )
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    "Removing reaction.",
+                    extra={
+                        "message_id": reaction.message.id,
+                        "user_id": user.id,
+                        "emoji": str(reaction.emoji),
+                    },
+                )
             await reaction.remove(user)
         except discord.HTTPException as e:
             log.warning(
@@ -1,6 +1,6 @@
 import asyncio
 import logging
-from typing import List, Optional
+from typing import List, Optional, Set
 
 import discord
 
@@ -23,6 +23,7 @@ class ThreadManager:
         """
         self.thread_titler = thread_titler
         self.max_message_length = Settings.MAX_DISCORD_MESSAGE_LENGTH
+        self._title_tasks: Set[asyncio.Task] = set()
         log.debug("ThreadManager initialized.")
 
     async def create_thread_if_needed(
@@ -114,7 +115,9 @@ class ThreadManager:
                     )
                 log.debug("Finished thread title update task.", extra={"thread_id": thread.id})
 
-            asyncio.create_task(update_thread_title())
+            title_task = asyncio.create_task(update_thread_title())
+            self._title_tasks.add(title_task)
+            title_task.add_done_callback(self._title_tasks.discard)
             if rest_of_content:
                 thread_chunks = split_func(rest_of_content)
                 for chunk in thread_chunks:
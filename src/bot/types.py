@@ -2,7 +2,7 @@ import asyncio
 import uuid
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Set, TypedDict
 
 import discord
 from google.genai import types as gemini_types
@@ -72,7 +72,7 @@ class ParsedMessageContext:
     scraped_url_data: List[ScrapedData] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Request:
     message: discord.Message
     original_message_id: int
@@ -80,6 +80,7 @@ class Request:
     state: RequestState = RequestState.PENDING
     task: Optional[asyncio.Task] = None
     bot_messages: List[discord.Message] = field(default_factory=list)
+    bot_message_ids: Set[int] = field(default_factory=set)
     messages_ready: asyncio.Event = field(default_factory=asyncio.Event)
     context: Optional[ParsedMessageContext] = None
     cancel_emoji_added: bool = False
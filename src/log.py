@@ -253,7 +253,6 @@ def setup_logging():
     if logger.hasHandlers():
         logger.debug("Logging already configured.")
         return logger
-    logger.setLevel(logging.DEBUG)
     logger.propagate = False
     if Settings.LOG_CONSOLE_ENABLED:
         console_handler = logging.StreamHandler()
@@ -272,6 +271,7 @@ def setup_logging():
         file_handler.setLevel(Settings.LOG_FILE_LEVEL)
         file_handler.setFormatter(JsonFormatter())
         logger.addHandler(file_handler)
+    logger.setLevel(min((handler.level for handler in logger.handlers), default=logging.WARNING))
     logging.getLogger("google_genai.models").setLevel(logging.ERROR)
     logger.info("Logging configured successfully.")
     return logger
@@ -56,6 +56,8 @@ class Settings:
     MAX_REQUESTS = 1000
     # The maximum number of active chat sessions to keep in memory.
     MAX_SESSIONS = 500
+    # The number of workers sending queued messages to Discord.
+    MESSAGE_QUEUE_WORKERS = 8
     # The token budget for Gemini's internal "thinking" process when using tools.
     # Note: For Gemini 3 models, this is legacy. Use THINKING_LEVEL instead.
     THINKING_BUDGET = 128
@@ -80,6 +82,8 @@ class Settings:
     MEMORY_DIR = "data/memories/"
     # The directory where scraped content is cached.
     CACHE_DIR = "data/cache/"
+    # Write typing signal files to CACHE_DIR while the bot is typing (used by the test harness).
+    TYPING_SIGNAL_FILES = True
     # The directory containing Playwright browser extensions
     PLAYWRIGHT_EXTENSIONS_PATH = "data/extensions/"
     # The directory containing persistent browser data